@@ -1,12 +1,179 @@
 from mcp.server.fastmcp import FastMCP
+import base64
 import boto3
+import heapq
+import inspect
 import json
+import os
+import threading
+import time
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
+from collections import Counter, OrderedDict
+from functools import partial, wraps
+from itertools import zip_longest
 from typing import Dict, List, Any, Optional
 
 # Initialize the MCP Server
 mcp = FastMCP("AWS Resource Inspector")
 
+# all_regions mode: regions are queried in parallel and a region that does not
+# answer within the timeout is reported instead of blocking the whole tool call
+REGION_WORKERS = 32
+REGION_TIMEOUT_SECONDS = 20
+# Concurrent DescribeTable calls in list_dynamodb_tables, shared by all
+# regions so all_regions mode stays at REGION_WORKERS + DESCRIBE_WORKERS threads
+DESCRIBE_WORKERS = 16
+CLIENT_CONFIG = Config(connect_timeout=5, read_timeout=15, retries={'max_attempts': 3, 'mode': 'standard'},
+                       max_pool_connections=DESCRIBE_WORKERS)
+# Tool responses are reused for this long unless force_refresh=True
+CACHE_TTL_SECONDS = int(os.environ.get("MCP_CACHE_TTL_SECONDS", "300"))
+CACHE_MAX_ENTRIES = int(os.environ.get("MCP_CACHE_MAX_ENTRIES", "256"))
+# Response size controls: items per page, and the most items a summary reads
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 1000
+SUMMARY_MAX_ITEMS = 100000
+SUMMARY_TOP_N = 5
+SUMMARY_MAX_GROUPS = 20
+# (min, max) page size each list call accepts; PageSize is clamped to it
+PAGE_SIZE_LIMITS = {
+    'list_buckets': (1, 10000),
+    'list_objects_v2': (1, 1000),
+    'describe_instances': (5, 1000),
+    'list_functions': (1, 50),
+    'list_tables': (1, 100),
+}
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of tool responses with a per-entry TTL.
+    """
+    def __init__(self, ttl_seconds: int = CACHE_TTL_SECONDS, max_entries: int = CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.expirations = self.evictions = 0
+
+    def get(self, key: tuple) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: tuple, value: str):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "Entries": len(self._entries),
+                "MaxEntries": self.max_entries,
+                "TtlSeconds": self.ttl_seconds,
+                "Hits": self.hits,
+                "Misses": self.misses,
+                "HitRate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "Expirations": self.expirations,
+                "Evictions": self.evictions,
+                "CachedTools": sorted({key[0] for key in self._entries})
+            }
+
+def cached_response(method):
+    """
+    Caches a manager method's response per (method, arguments). Defaults are
+    applied before building the key so equivalent calls share an entry;
+    error responses and partial all_regions responses (with RegionErrors)
+    are never cached. force_refresh=True bypasses the lookup and stores the
+    fresh response.
+    """
+    signature = inspect.signature(method)
+
+    @wraps(method)
+    def wrapper(self, *args, force_refresh: bool = False, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__,) + tuple(bound.arguments.items())[1:]
+
+        if not force_refresh:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        result = method(self, *args, **kwargs)
+        if not result.startswith("Error") and not is_partial_response(result):
+            self.cache.set(key, result)
+        return result
+    return wrapper
+
+def is_partial_response(result: str) -> bool:
+    """True for an all_regions response in which some regions failed or timed out"""
+    # Substring check first so ordinary responses are not parsed again
+    if '"RegionErrors"' not in result:
+        return False
+    try:
+        return "RegionErrors" in json.loads(result)
+    except ValueError:
+        return False
+
+def to_json(obj: Any) -> str:
+    """Compact JSON for tool responses (no indentation, unicode kept as is)"""
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=str)
+
+def select_fields(items: List[Dict[str, Any]], fields: str) -> List[Dict[str, Any]]:
+    """Keeps only the comma-separated fields of each item (all fields when empty)"""
+    wanted = [field.strip() for field in fields.split(',') if field.strip()]
+    if not wanted:
+        return items
+    return [{field: item[field] for field in wanted if field in item} for item in items]
+
+def summarize_items(items: List[Dict[str, Any]], group_by: tuple = (), sum_fields: tuple = (),
+                    label_field: Optional[str] = None, date_field: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Server-side summary of a listing: item count, counts per group_by value,
+    totals of sum_fields, the largest items by the first sum field and the
+    oldest/newest item by date_field.
+    """
+    summary: Dict[str, Any] = {"Count": len(items)}
+    for field in group_by:
+        counts = Counter(str(item.get(field, 'N/A')) for item in items)
+        groups = dict(counts.most_common(SUMMARY_MAX_GROUPS))
+        other = sum(counts.values()) - sum(groups.values())
+        if other:
+            groups["(other)"] = other
+        summary[f"By{field}"] = groups
+    for field in sum_fields:
+        summary[f"Total{field}"] = sum(item.get(field) or 0 for item in items)
+    if sum_fields and label_field:
+        key = sum_fields[0]
+        summary[f"LargestBy{key}"] = [
+            {label_field: item.get(label_field), key: item.get(key)}
+            for item in heapq.nlargest(SUMMARY_TOP_N, items, key=lambda item: item.get(key) or 0)
+        ]
+    dated = [item for item in items if item.get(date_field)] if date_field else []
+    if dated and label_field:
+        oldest = min(dated, key=lambda item: item[date_field])
+        newest = max(dated, key=lambda item: item[date_field])
+        summary["Oldest"] = {label_field: oldest.get(label_field), date_field: oldest[date_field]}
+        summary["Newest"] = {label_field: newest.get(label_field), date_field: newest[date_field]}
+    return summary
+
 class AWSResourceManager:
     """
     Handles AWS resource interactions with proper error handling 
@@ -14,12 +181,20 @@ class AWSResourceManager:
     """
     def __init__(self):
         self._clients: Dict[str, Any] = {}
+        self._regions: Optional[List[str]] = None
+        # boto3 client creation is not thread-safe
+        self._client_lock = threading.Lock()
+        self.cache = ResponseCache()
+        # One bounded pool for per-item describe calls, shared by all regions
+        self._describe_executor = ThreadPoolExecutor(max_workers=DESCRIBE_WORKERS,
+                                                     thread_name_prefix="describe")
 
     def get_client(self, service_name: str, region_name: str = "us-east-1"):
         """Lazy loading of AWS clients to improve startup time"""
         cache_key = f"{service_name}_{region_name}"
-        if cache_key not in self._clients:
-            self._clients[cache_key] = boto3.client(service_name, region_name=region_name)
+        with self._client_lock:
+            if cache_key not in self._clients:
+                self._clients[cache_key] = boto3.client(service_name, region_name=region_name, config=CLIENT_CONFIG)
         return self._clients[cache_key]
 
     def _format_date(self, obj: Any) -> str:
@@ -28,27 +203,77 @@ class AWSResourceManager:
             return obj.isoformat()
         return str(obj)
 
-    def list_s3_buckets(self) -> str:
+    def _paginate(self, client, operation: str, result_key: str, max_items: Optional[int] = None,
+                  cursor: str = "", **kwargs):
+        """
+        Reads up to max_items items of a paginated AWS list call, starting at
+        cursor. Pages are requested at max_items (within PAGE_SIZE_LIMITS) so
+        AWS is not asked for more items than are returned. Returns (items,
+        next_cursor); next_cursor is botocore's resume token (the AWS token
+        plus how many items of its page were already returned), or None when
+        the listing is complete.
+        """
+        config = {'MaxItems': max_items}
+        if operation in PAGE_SIZE_LIMITS:
+            low, high = PAGE_SIZE_LIMITS[operation]
+            config['PageSize'] = max(low, min(max_items or high, high))
+        if cursor:
+            config['StartingToken'] = cursor
+        result = client.get_paginator(operation).paginate(PaginationConfig=config, **kwargs).build_full_result()
+        return result.get(result_key, []), result.get('NextToken')
+
+    def _page_size(self, limit: int, summarize: bool) -> int:
+        # Summaries read (up to SUMMARY_MAX_ITEMS) everything, listings one page
+        return SUMMARY_MAX_ITEMS if summarize else max(1, min(limit, MAX_LIMIT))
+
+    def _respond(self, items: List[Dict[str, Any]], next_cursor: Optional[str], fields: str,
+                 summarize: bool, summary: Dict[str, Any]) -> str:
+        """Builds the compact response: a summary or the (field-selected) items, plus the next cursor"""
+        if summarize:
+            result = summarize_items(items, **summary)
+        else:
+            result = {"Count": len(items), "Items": select_fields(items, fields)}
+        if next_cursor:
+            result["NextCursor"] = next_cursor
+        return to_json(result)
+
+    @cached_response
+    def list_s3_buckets(self, limit: int = DEFAULT_LIMIT, cursor: str = "", fields: str = "",
+                        summarize: bool = False) -> str:
         try:
             s3 = self.get_client('s3')
-            response = s3.list_buckets()
+            page_size = self._page_size(limit, summarize)
+            if s3.can_paginate('list_buckets'):
+                response, next_cursor = self._paginate(s3, 'list_buckets', 'Buckets', page_size, cursor)
+            else:
+                # botocore < 1.35 has no list_buckets paginator: one call returns
+                # every bucket, paged here by offset
+                start = int(cursor or 0)
+                all_buckets = s3.list_buckets()['Buckets']
+                response = all_buckets[start:start + page_size]
+                next_cursor = str(start + page_size) if start + page_size < len(all_buckets) else None
             buckets = [
                 {
                     "Name": b['Name'],
                     "CreationDate": self._format_date(b['CreationDate'])
                 }
-                for b in response.get('Buckets', [])
+                for b in response
             ]
-            return json.dumps(buckets, indent=2)
+            return self._respond(buckets, next_cursor, fields, summarize,
+                                 {"label_field": "Name", "date_field": "CreationDate"})
         except Exception as e:
             return f"Error listing buckets: {str(e)}"
 
-    def list_s3_objects(self, bucket_name: str, prefix: str = "") -> str:
+    @cached_response
+    def list_s3_objects(self, bucket_name: str, prefix: str = "", limit: int = DEFAULT_LIMIT, cursor: str = "",
+                        fields: str = "", summarize: bool = False) -> str:
         try:
             s3 = self.get_client('s3')
-            response = s3.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
+            contents, next_cursor = self._paginate(s3, 'list_objects_v2', 'Contents',
+                                                   self._page_size(limit, summarize), cursor,
+                                                   Bucket=bucket_name, Prefix=prefix)
             
-            if 'Contents' not in response:
+            if not contents and not cursor:
                 return f"No objects found in bucket {bucket_name}"
                 
             objects = [
@@ -57,90 +282,246 @@ class AWSResourceManager:
                     "Size": obj['Size'],
                     "LastModified": self._format_date(obj['LastModified'])
                 }
-                for obj in response['Contents']
+                for obj in contents
             ]
-            return json.dumps(objects, indent=2)
+            if summarize:
+                # Group by the first folder below the prefix and by file extension
+                for obj in objects:
+                    relative = obj['Key'][len(prefix):]
+                    obj['Folder'] = relative.split('/', 1)[0] + '/' if '/' in relative else '(root)'
+                    name = relative.rsplit('/', 1)[-1]
+                    obj['Extension'] = name.rsplit('.', 1)[-1].lower() if '.' in name else '(none)'
+            return self._respond(objects, next_cursor, fields, summarize, {
+                "group_by": ("Folder", "Extension"), "sum_fields": ("Size",),
+                "label_field": "Key", "date_field": "LastModified"
+            })
         except Exception as e:
             return f"Error listing objects in {bucket_name}: {str(e)}"
 
-    def list_ec2_instances(self, region_name: str) -> str:
+    def get_regions(self, service_name: str) -> List[str]:
+        """Regions enabled for this account that offer the service (cached)"""
+        if self._regions is None:
+            try:
+                response = self.get_client('ec2').describe_regions(AllRegions=False)
+                self._regions = sorted(r['RegionName'] for r in response['Regions'])
+            except Exception:
+                # No ec2:DescribeRegions permission: fall back to the SDK's region list
+                self._regions = sorted(boto3.session.Session().get_available_regions('ec2'))
+        available = set(boto3.session.Session().get_available_regions(service_name))
+        return [region for region in self._regions if region in available]
+
+    def _fan_out(self, fetch, regions: List[str]):
+        """
+        Runs fetch(region) for all regions in parallel. Returns (results,
+        errors): each answering region's (items, next_cursor), and regions
+        that failed or exceeded REGION_TIMEOUT_SECONDS in the errors dict
+        instead of failing the whole call.
+        """
+        executor = ThreadPoolExecutor(max_workers=max(1, min(REGION_WORKERS, len(regions))))
+        futures = {region: executor.submit(fetch, region) for region in regions}
+        done, _ = wait(futures.values(), timeout=REGION_TIMEOUT_SECONDS)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        results, errors = {}, {}
+        for region, future in futures.items():
+            if future not in done:
+                errors[region] = f"Timed out after {REGION_TIMEOUT_SECONDS}s"
+                continue
+            try:
+                results[region] = future.result()
+            except Exception as e:
+                errors[region] = str(e)
+        return results, errors
+
+    def _encode_region_cursor(self, positions: Dict[str, List[Any]]) -> Optional[str]:
+        if not positions:
+            return None
+        return base64.urlsafe_b64encode(json.dumps(positions, separators=(',', ':')).encode()).decode()
+
+    def _decode_region_cursor(self, cursor: str) -> Dict[str, List[Any]]:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()))
+
+    def _list_all_regions(self, fetch, service_name: str, label: str, limit: int, cursor: str, fields: str,
+                          summarize: bool, summary: Dict[str, Any]) -> str:
+        """
+        all_regions mode. Summaries read every region (up to
+        SUMMARY_MAX_ITEMS each) and report Truncated if a region had more.
+
+        Listings interleave the regions round-robin before cutting to limit,
+        so every region contributes to each page. NextCursor is a composite
+        cursor holding, per region that still has items, the region's own
+        cursor and how many items after it were already returned; regions
+        missing from it are finished. Regions that fail are reported in
+        RegionErrors and not retried on later pages.
+        """
+        page_size = self._page_size(limit, summarize)
+        if summarize:
+            regions = self.get_regions(service_name)
+            results, errors = self._fan_out(lambda region: fetch(region, page_size), regions)
+            items = [{"Region": region, **item} for region, (region_items, _) in results.items()
+                     for item in region_items]
+            if not items and not errors:
+                return f"No {label} found in any region."
+            summary = dict(summary, group_by=("Region",) + tuple(summary.get("group_by", ())))
+            result = {"RegionsScanned": len(regions), **summarize_items(items, **summary)}
+            if any(next_cursor for _, next_cursor in results.values()):
+                result["Truncated"] = True
+        else:
+            positions = self._decode_region_cursor(cursor) if cursor else \
+                {region: ["", 0] for region in self.get_regions(service_name)}
+            regions = sorted(positions)
+            # A region resumes from its cursor, skipping the items it already returned
+            results, errors = self._fan_out(
+                lambda region: fetch(region, positions[region][1] + page_size, positions[region][0]), regions)
+            batches = [[{"Region": region, **item} for item in results[region][0][positions[region][1]:]]
+                       for region in regions if region in results]
+            items = [item for group in zip_longest(*batches) for item in group if item is not None][:page_size]
+            if not items and not errors and not cursor:
+                return f"No {label} found in any region."
+
+            taken = Counter(item["Region"] for item in items)
+            next_positions = {}
+            for region, (region_items, next_cursor) in results.items():
+                returned = positions[region][1] + taken[region]
+                if returned < len(region_items):
+                    next_positions[region] = [positions[region][0], returned]
+                elif next_cursor:
+                    next_positions[region] = [next_cursor, 0]
+            result = {"RegionsScanned": len(regions), "Count": len(items),
+                      "Items": select_fields(items, fields)}
+            next_cursor = self._encode_region_cursor(next_positions)
+            if next_cursor:
+                result["NextCursor"] = next_cursor
+        if errors:
+            result["RegionErrors"] = errors
+        return to_json(result)
+
+    def _fetch_ec2_instances(self, region_name: str, max_items: Optional[int] = None,
+                             cursor: str = ""):
+        ec2 = self.get_client('ec2', region_name)
+        instances = []
+
+        # EC2 pages by reservation; a reservation usually holds one instance
+        reservations, next_cursor = self._paginate(ec2, 'describe_instances', 'Reservations', max_items, cursor)
+        for reservation in reservations:
+            for instance in reservation.get('Instances', []):
+                name = "N/A"
+                if 'Tags' in instance:
+                    name = next((t['Value'] for t in instance['Tags'] if t['Key'] == 'Name'), "N/A")
+
+                instances.append({
+                    "InstanceId": instance['InstanceId'],
+                    "Name": name,
+                    "InstanceType": instance['InstanceType'],
+                    "State": instance['State']['Name'],
+                    "PublicIp": instance.get('PublicIpAddress', 'N/A'),
+                    "AvailabilityZone": instance.get('Placement', {}).get('AvailabilityZone', 'N/A'),
+                    "LaunchTime": self._format_date(instance['LaunchTime'])
+                })
+        return instances, next_cursor
+
+    @cached_response
+    def list_ec2_instances(self, region_name: str, all_regions: bool = False, limit: int = DEFAULT_LIMIT,
+                           cursor: str = "", fields: str = "", summarize: bool = False) -> str:
+        summary = {"group_by": ("State", "InstanceType", "AvailabilityZone"), "label_field": "InstanceId",
+                   "date_field": "LaunchTime"}
         try:
-            ec2 = self.get_client('ec2', region_name)
-            response = ec2.describe_instances()
-            instances = []
-            
-            for reservation in response.get('Reservations', []):
-                for instance in reservation.get('Instances', []):
-                    name = "N/A"
-                    if 'Tags' in instance:
-                        name = next((t['Value'] for t in instance['Tags'] if t['Key'] == 'Name'), "N/A")
-                                
-                    instances.append({
-                        "InstanceId": instance['InstanceId'],
-                        "Name": name,
-                        "InstanceType": instance['InstanceType'],
-                        "State": instance['State']['Name'],
-                        "PublicIp": instance.get('PublicIpAddress', 'N/A'),
-                        "AvailabilityZone": instance.get('Placement', {}).get('AvailabilityZone', 'N/A'),
-                        "LaunchTime": self._format_date(instance['LaunchTime'])
-                    })
-            
-            if not instances:
+            if all_regions:
+                return self._list_all_regions(self._fetch_ec2_instances, 'ec2', "EC2 instances",
+                                              limit, cursor, fields, summarize, summary)
+
+            instances, next_cursor = self._fetch_ec2_instances(region_name, self._page_size(limit, summarize),
+                                                               cursor)
+            if not instances and not cursor:
                 return f"No EC2 instances found in region {region_name}."
                 
-            return json.dumps(instances, indent=2)
+            return self._respond(instances, next_cursor, fields, summarize, summary)
         except Exception as e:
             return f"Error listing instances in {region_name}: {str(e)}"
 
-    def list_lambda_functions(self, region_name: str) -> str:
+    def _fetch_lambda_functions(self, region_name: str, max_items: Optional[int] = None,
+                                cursor: str = ""):
+        lambda_client = self.get_client('lambda', region_name)
+        functions, next_cursor = self._paginate(lambda_client, 'list_functions', 'Functions', max_items, cursor)
+        return [
+            {
+                "FunctionName": func['FunctionName'],
+                # Container image functions have no runtime
+                "Runtime": func.get('Runtime', 'N/A'),
+                "Handler": func.get('Handler', 'N/A'),
+                "LastModified": func['LastModified'],
+                "CodeSize": func['CodeSize'],
+                "Description": func.get('Description', "")
+            }
+            for func in functions
+        ], next_cursor
+
+    @cached_response
+    def list_lambda_functions(self, region_name: str, all_regions: bool = False, limit: int = DEFAULT_LIMIT,
+                              cursor: str = "", fields: str = "", summarize: bool = False) -> str:
+        summary = {"group_by": ("Runtime",), "sum_fields": ("CodeSize",), "label_field": "FunctionName",
+                   "date_field": "LastModified"}
         try:
-            lambda_client = self.get_client('lambda', region_name)
-            response = lambda_client.list_functions()
-            functions = []
-            
-            for func in response.get('Functions', []):
-                functions.append({
-                    "FunctionName": func['FunctionName'],
-                    "Runtime": func['Runtime'],
-                    "Handler": func['Handler'],
-                    "LastModified": func['LastModified'],
-                    "CodeSize": func['CodeSize'],
-                    "Description": func.get('Description', "")
-                })
-                
-            if not functions:
+            if all_regions:
+                return self._list_all_regions(self._fetch_lambda_functions, 'lambda', "Lambda functions",
+                                              limit, cursor, fields, summarize, summary)
+
+            functions, next_cursor = self._fetch_lambda_functions(region_name, self._page_size(limit, summarize),
+                                                                  cursor)
+            if not functions and not cursor:
                 return f"No Lambda functions found in region {region_name}."
                 
-            return json.dumps(functions, indent=2)
+            return self._respond(functions, next_cursor, fields, summarize, summary)
         except Exception as e:
             return f"Error listing lambda functions: {str(e)}"
 
-    def list_dynamodb_tables(self, region_name: str) -> str:
+    def _describe_table(self, dynamo, name: str) -> Dict[str, Any]:
+        # We catch errors per table to allow partial results
         try:
-            dynamo = self.get_client('dynamodb', region_name)
-            response = dynamo.list_tables()
-            table_names = response.get('TableNames', [])
-            
-            if not table_names:
+            desc = dynamo.describe_table(TableName=name)['Table']
+            return {
+                "TableName": name,
+                "Status": desc['TableStatus'],
+                "ItemCount": desc.get('ItemCount', 0),
+                "SizeBytes": desc.get('TableSizeBytes', 0),
+                "CreationDateTime": self._format_date(desc['CreationDateTime'])
+            }
+        except Exception:
+            return {"TableName": name, "Error": "Could not fetch details"}
+
+    def _fetch_dynamodb_tables(self, region_name: str, max_items: Optional[int] = None, cursor: str = "",
+                               summary_only: bool = False):
+        dynamo = self.get_client('dynamodb', region_name)
+        table_names, next_cursor = self._paginate(dynamo, 'list_tables', 'TableNames', max_items, cursor)
+
+        if summary_only or not table_names:
+            return [{"TableName": name} for name in table_names], next_cursor
+
+        # Fetch details for each table (Summary) on the shared describe pool,
+        # so parallel regions do not each start their own; results keep the
+        # listing order
+        return list(self._describe_executor.map(lambda name: self._describe_table(dynamo, name),
+                                                table_names)), next_cursor
+
+    @cached_response
+    def list_dynamodb_tables(self, region_name: str, all_regions: bool = False, summary_only: bool = False,
+                             limit: int = DEFAULT_LIMIT, cursor: str = "", fields: str = "",
+                             summarize: bool = False) -> str:
+        summary = {"label_field": "TableName"} if summary_only else {
+            "group_by": ("Status",), "sum_fields": ("SizeBytes", "ItemCount"), "label_field": "TableName",
+            "date_field": "CreationDateTime"
+        }
+        try:
+            fetch = partial(self._fetch_dynamodb_tables, summary_only=summary_only)
+            if all_regions:
+                return self._list_all_regions(fetch, 'dynamodb', "DynamoDB tables",
+                                              limit, cursor, fields, summarize, summary)
+
+            formatted_tables, next_cursor = fetch(region_name, self._page_size(limit, summarize), cursor)
+            if not formatted_tables and not cursor:
                 return f"No DynamoDB tables found in region {region_name}."
-            
-            # Fetch details for each table (Summary)
-            formatted_tables = []
-            for name in table_names:
-                # We catch errors per table to allow partial results
-                try:
-                    desc = dynamo.describe_table(TableName=name)['Table']
-                    formatted_tables.append({
-                        "TableName": name,
-                        "Status": desc['TableStatus'],
-                        "ItemCount": desc.get('ItemCount', 0),
-                        "SizeBytes": desc.get('TableSizeBytes', 0),
-                        "CreationDateTime": self._format_date(desc['CreationDateTime'])
-                    })
-                except Exception:
-                    formatted_tables.append({"TableName": name, "Error": "Could not fetch details"})
-
-            return json.dumps(formatted_tables, indent=2)
+
+            return self._respond(formatted_tables, next_cursor, fields, summarize, summary)
         except Exception as e:
             return f"Error listing DynamoDB tables: {str(e)}"
 
@@ -150,36 +531,84 @@ aws_manager = AWSResourceManager()
 
 # --- MCP Tools Registration ---
 
+# Shared arguments of the list tools:
+#   limit     - items per response (default 50, max 1000)
+#   cursor    - NextCursor from a previous response, to fetch the next page
+#   fields    - comma-separated fields to return, e.g. "Key,Size"
+#   summarize - return counts, totals and top items instead of the items
+
 @mcp.tool()
-def list_s3_buckets() -> str:
-    """Lists all S3 buckets in the AWS account."""
-    return aws_manager.list_s3_buckets()
+def list_s3_buckets(limit: int = DEFAULT_LIMIT, cursor: str = "", fields: str = "", summarize: bool = False,
+                    force_refresh: bool = False) -> str:
+    """
+    Lists S3 buckets in the AWS account, `limit` at a time.
+    Pass the returned NextCursor as `cursor` for the next page; `fields`
+    (comma-separated) selects fields; summarize=True returns counts only.
+    """
+    return aws_manager.list_s3_buckets(limit, cursor, fields, summarize, force_refresh=force_refresh)
 
 @mcp.tool()
-def list_s3_objects(bucket_name: str, prefix: str = "") -> str:
-    """Lists objects in a specific S3 bucket."""
-    return aws_manager.list_s3_objects(bucket_name, prefix)
+def list_s3_objects(bucket_name: str, prefix: str = "", limit: int = DEFAULT_LIMIT, cursor: str = "",
+                    fields: str = "", summarize: bool = False, force_refresh: bool = False) -> str:
+    """
+    Lists objects in a specific S3 bucket, `limit` at a time.
+    Pass the returned NextCursor as `cursor` for the next page; `fields`
+    (comma-separated) selects fields. summarize=True returns object count,
+    total size, counts per folder/extension and the largest objects instead.
+    """
+    return aws_manager.list_s3_objects(bucket_name, prefix, limit, cursor, fields, summarize,
+                                       force_refresh=force_refresh)
 
 @mcp.tool()
-def list_ec2_instances(region_name: str = "us-east-1") -> str:
-    """Lists all EC2 instances in a specific region."""
-    return aws_manager.list_ec2_instances(region_name)
+def list_ec2_instances(region_name: str = "us-east-1", all_regions: bool = False, limit: int = DEFAULT_LIMIT,
+                       cursor: str = "", fields: str = "", summarize: bool = False,
+                       force_refresh: bool = False) -> str:
+    """
+    Lists EC2 instances in a specific region, `limit` at a time.
+    Set all_regions=True to scan every enabled region in parallel.
+    Pass the returned NextCursor as `cursor` for the next page; `fields`
+    selects fields; summarize=True returns counts by state, type and zone.
+    """
+    return aws_manager.list_ec2_instances(region_name, all_regions, limit, cursor, fields, summarize,
+                                          force_refresh=force_refresh)
 
 @mcp.tool()
-def list_lambda_functions(region_name: str = "us-east-1") -> str:
+def list_lambda_functions(region_name: str = "us-east-1", all_regions: bool = False, limit: int = DEFAULT_LIMIT,
+                          cursor: str = "", fields: str = "", summarize: bool = False,
+                          force_refresh: bool = False) -> str:
     """
-    Lists all Lambda functions in a specific region.
+    Lists Lambda functions in a specific region, `limit` at a time.
     Returns function name, runtime, and other metadata.
+    Set all_regions=True to scan every enabled region in parallel.
+    Pass the returned NextCursor as `cursor` for the next page; `fields`
+    selects fields; summarize=True returns counts by runtime and code size.
     """
-    return aws_manager.list_lambda_functions(region_name)
+    return aws_manager.list_lambda_functions(region_name, all_regions, limit, cursor, fields, summarize,
+                                             force_refresh=force_refresh)
 
 @mcp.tool()
-def list_dynamodb_tables(region_name: str = "us-east-1") -> str:
+def list_dynamodb_tables(region_name: str = "us-east-1", all_regions: bool = False, summary_only: bool = False,
+                         limit: int = DEFAULT_LIMIT, cursor: str = "", fields: str = "", summarize: bool = False,
+                         force_refresh: bool = False) -> str:
     """
-    Lists all DynamoDB tables in a specific region.
+    Lists DynamoDB tables in a specific region, `limit` at a time.
     Includes summary details like item count and status.
+    Set all_regions=True to scan every enabled region in parallel.
+    Set summary_only=True to return table names only (fast, no per-table calls).
+    Pass the returned NextCursor as `cursor` for the next page; `fields`
+    selects fields; summarize=True returns counts, total items and size.
+    """
+    return aws_manager.list_dynamodb_tables(region_name, all_regions, summary_only, limit, cursor, fields,
+                                            summarize, force_refresh=force_refresh)
+
+@mcp.tool()
+def get_cache_stats() -> str:
+    """
+    Shows the tool response cache statistics (entries, hits, misses, hit rate).
+    Responses are reused for a few minutes; pass force_refresh=True to a tool
+    to fetch fresh data from AWS.
     """
-    return aws_manager.list_dynamodb_tables(region_name)
+    return to_json(aws_manager.cache.stats())
 
 if __name__ == "__main__":
     mcp.run()
@@ -0,0 +1,94 @@
+"""
+PPTX Converter Benchmark
+========================
+Generates synthetic 10/100/1000-slide decks and measures slides/sec for the
+extraction and PDF rendering stages of converter_lambda, with sequential and
+multi-process extraction.
+
+Runs locally without AWS access (python-pptx and reportlab must be installed):
+
+    pip install python-pptx reportlab boto3
+    python converter_benchmark.py
+    python converter_benchmark.py --sizes 100 1000 --processes 4
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+# converter_lambda creates an S3 client at import time; no request is ever sent
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+from pptx import Presentation
+
+import converter_lambda
+
+
+def build_deck(slide_count, path):
+    """Create a deck with a title and several multi-run bullet paragraphs per slide."""
+    presentation = Presentation()
+    layout = presentation.slide_layouts[1]
+    for i in range(1, slide_count + 1):
+        slide = presentation.slides.add_slide(layout)
+        slide.shapes.title.text = f"Benchmark Slide {i}"
+        text_frame = slide.placeholders[1].text_frame
+        for j in range(6):
+            paragraph = text_frame.paragraphs[0] if j == 0 else text_frame.add_paragraph()
+            for k in range(4):
+                run = paragraph.add_run()
+                run.text = f"Point {j}.{k} with some serverless & <pdf> text "
+    presentation.save(path)
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def benchmark(slide_count, processes, workdir):
+    pptx_path = os.path.join(workdir, f"deck_{slide_count}.pptx")
+    pdf_path = os.path.join(workdir, f"deck_{slide_count}.pdf")
+    build_deck(slide_count, pptx_path)
+
+    presentation, open_time = timed(Presentation, pptx_path)
+    slides, sequential_time = timed(
+        lambda: [converter_lambda.extract_slide_content(slide, idx)
+                 for idx, slide in enumerate(presentation.slides, start=1)]
+    )
+
+    parallel_time = None
+    if processes > 1:
+        parallel_slides, parallel_time = timed(
+            converter_lambda.extract_slides_parallel, pptx_path, slide_count, processes
+        )
+        assert parallel_slides == slides, "parallel extraction must match sequential output"
+
+    _, render_time = timed(
+        converter_lambda.create_pdf_from_content, slides, converter_lambda.deck_title(slides), output=pdf_path
+    )
+
+    print(f"{slide_count:>7} {open_time * 1000:>9.1f} "
+          f"{slide_count / sequential_time:>12.0f} "
+          f"{(slide_count / parallel_time) if parallel_time else float('nan'):>12.0f} "
+          f"{slide_count / render_time:>10.0f} "
+          f"{slide_count / (open_time + sequential_time + render_time):>10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark converter_lambda extraction and rendering')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1,
+                        help='Processes for parallel extraction (1 disables it)')
+    args = parser.parse_args()
+
+    print("⏱️ PPTX Converter Benchmark (slides/sec)")
+    print(f"{'slides':>7} {'open ms':>9} {'extract seq':>12} {'extract par':>12} {'render':>10} {'total':>10}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for slide_count in args.sizes:
+            benchmark(slide_count, args.processes, workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,25 @@ Triggered by S3 .pptx uploads in the 'pptxs/' prefix.
 Uses python-pptx to extract content and reportlab to generate PDF summaries.
 """
 
+import hashlib
 import json
+import multiprocessing
 import os
+import re
+import tempfile
+import traceback
+import unicodedata
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from io import BytesIO
 
 from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
 from pptx.util import Inches
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -24,46 +36,185 @@ from urllib.parse import unquote_plus
 # Initialize S3 client
 s3_client = boto3.client('s3')
 
+# Large inputs/outputs are spooled to local disk instead of being held in memory
+SPOOL_DIR = os.environ.get('SPOOL_DIR', tempfile.gettempdir())
+
+# Conversion cache keyed by the source object's ETag (cache/<etag>.json -> PDF path)
+CACHE_ENABLED = os.environ.get('CONVERSION_CACHE', 'true').lower() == 'true'
+CACHE_PREFIX = 'cache/'
+
+# Output formats produced from the single parse of each deck
+# (pdf, markdown, outline, thumbnails); thumbnails are opt-in.
+OUTPUT_FORMATS = {
+    fmt.strip() for fmt in os.environ.get('OUTPUT_FORMATS', 'pdf,markdown,outline').split(',') if fmt.strip()
+}
+
+# Outputs that do not embed the file name and can be copied between documents
+COPYABLE_OUTPUTS = ('pdf', 'thumbnails')
+
+# Search terms stored in the metadata for the dashboard's search index
+# (normalised like normalize_search_text() in dashboard_lambda.py)
+TERM_PATTERN = re.compile(r'\w+')
+MIN_TERM_LENGTH = 2
+MAX_SEARCH_TERMS = int(os.environ.get('MAX_SEARCH_TERMS', '300'))
+
+# Large decks can be extracted in several processes (set PARALLEL_EXTRACT_PROCESSES > 1);
+# only used when the function has more than one vCPU (>= 1769 MB on Lambda)
+PARALLEL_EXTRACT_PROCESSES = int(os.environ.get('PARALLEL_EXTRACT_PROCESSES', '1'))
+PARALLEL_EXTRACT_MIN_SLIDES = int(os.environ.get('PARALLEL_EXTRACT_MIN_SLIDES', '200'))
+
+# Downloads and uploads above the threshold use ranged GETs / multipart upload
+# with bounded part buffers, so peak memory does not grow with file size.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4
+)
+
 def extract_text_from_shape(shape):
     """Extract text from a shape if it has a text frame."""
     text_parts = []
     if shape.has_text_frame:
         for paragraph in shape.text_frame.paragraphs:
-            paragraph_text = ""
-            for run in paragraph.runs:
-                paragraph_text += run.text
-            if paragraph_text.strip():
-                text_parts.append(paragraph_text.strip())
+            paragraph_text = ''.join(run.text for run in paragraph.runs).strip()
+            if paragraph_text:
+                text_parts.append(paragraph_text)
     return text_parts
 
 def extract_slide_content(slide, slide_number):
-    """Extract all text content from a slide."""
-    slide_content = {
-        'slide_number': slide_number,
-        'title': None,
-        'content': []
-    }
+    """Extract all text content from a slide in a single pass over its shapes."""
+    # Look the title placeholder up once instead of once per shape
+    title_shape = slide.shapes.title
+    title_id = title_shape.shape_id if title_shape is not None else None
+    title_text = title_shape.text.strip() if title_shape is not None and title_shape.text else ''
     
-    # Try to get the slide title
-    if slide.shapes.title:
-        slide_content['title'] = slide.shapes.title.text.strip() if slide.shapes.title.text else f"Slide {slide_number}"
-    else:
-        slide_content['title'] = f"Slide {slide_number}"
-    
-    # Extract text from all shapes
+    content = []
     for shape in slide.shapes:
         # Skip the title shape as we already captured it
-        if slide.shapes.title and shape == slide.shapes.title:
+        if shape.shape_id == title_id:
             continue
-        
-        text_parts = extract_text_from_shape(shape)
-        slide_content['content'].extend(text_parts)
+        content.extend(extract_text_from_shape(shape))
     
-    return slide_content
+    return {
+        'slide_number': slide_number,
+        'title': title_text or f"Slide {slide_number}",
+        'content': content
+    }
 
-def create_pdf_from_content(slides_content, original_filename):
-    """Create a PDF document from extracted slide content using ReportLab."""
-    buffer = BytesIO()
+def _extract_slide_range(pptx_path, start, stop, conn):
+    """Worker process: extract slides [start, stop) from the deck on disk."""
+    try:
+        slides = Presentation(pptx_path).slides
+        conn.send([extract_slide_content(slides[idx], idx + 1) for idx in range(start, stop)])
+    except Exception as e:
+        conn.send(e)
+    finally:
+        conn.close()
+
+def extract_slides_parallel(pptx_path, slide_count, processes):
+    """
+    Extract slide content using several processes, each opening the deck and
+    handling a contiguous slide range. Uses Process + Pipe because
+    multiprocessing pools need /dev/shm, which Lambda does not provide.
+    
+    Processes are spawned, not forked: conversions run in handler threads, and
+    forking a multi-threaded process can deadlock on locks held by other threads.
+    """
+    context = multiprocessing.get_context('spawn')
+    chunk = -(-slide_count // processes)
+    workers = []
+    for start in range(0, slide_count, chunk):
+        parent_conn, child_conn = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_extract_slide_range,
+            args=(pptx_path, start, min(start + chunk, slide_count), child_conn)
+        )
+        process.start()
+        child_conn.close()
+        workers.append((process, parent_conn))
+    
+    slides_content = []
+    for process, conn in workers:
+        result = conn.recv()
+        process.join()
+        if isinstance(result, Exception):
+            raise result
+        slides_content.extend(result)
+    return slides_content
+
+def extract_slides(pptx_path, presentation):
+    """
+    Extract every slide, in parallel processes for large decks when enabled and
+    more than one CPU is available (spawning costs more than it saves otherwise).
+    """
+    slide_count = len(presentation.slides)
+    processes = min(PARALLEL_EXTRACT_PROCESSES, os.cpu_count() or 1)
+    if processes > 1 and slide_count >= PARALLEL_EXTRACT_MIN_SLIDES:
+        print(f"⚙️ Extracting {slide_count} slides with {processes} processes")
+        return extract_slides_parallel(pptx_path, slide_count, processes)
+    return list(iter_slide_content(presentation))
+
+def iter_slide_content(presentation):
+    """Yield extracted slide content one slide at a time."""
+    for idx, slide in enumerate(presentation.slides, start=1):
+        slide_data = extract_slide_content(slide, idx)
+        print(f"  ✅ Processed slide {idx}: {slide_data['title']}")
+        yield slide_data
+
+@lru_cache(maxsize=None)
+def get_pdf_styles():
+    """Build the ReportLab styles once per container and reuse them across invocations."""
+    sample = getSampleStyleSheet()
+    return {
+        'normal': sample['Normal'],
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=sample['Heading1'],
+            fontSize=24,
+            spaceAfter=30,
+            alignment=TA_CENTER,
+            textColor='#1a365d'
+        ),
+        'slide_title': ParagraphStyle(
+            'SlideTitle',
+            parent=sample['Heading2'],
+            fontSize=16,
+            spaceBefore=20,
+            spaceAfter=12,
+            textColor='#2d3748',
+            borderWidth=0,
+            borderPadding=0,
+            borderColor='#e2e8f0',
+            backColor='#f7fafc'
+        ),
+        'content': ParagraphStyle(
+            'ContentStyle',
+            parent=sample['Normal'],
+            fontSize=11,
+            spaceBefore=6,
+            spaceAfter=6,
+            leftIndent=20,
+            textColor='#4a5568'
+        )
+    }
+
+def deck_title(slides_content):
+    """Heading for a deck's PDF, taken from its first slide rather than the file name."""
+    return slides_content[0]['title'] if slides_content else 'Presentation'
+
+def create_pdf_from_content(slides_content, title, output=None, slide_count=None):
+    """
+    Create a PDF document from extracted slide content using ReportLab.
+    
+    `title` is the document heading (see deck_title()). The PDF deliberately
+    does not contain the file name, so a cached PDF can be copied as-is to a
+    document of another name.
+    `slides_content` may be any iterable (e.g. a generator from iter_slide_content).
+    `output` may be a file path or file object; an in-memory buffer is used if omitted.
+    """
+    buffer = output if output is not None else BytesIO()
+    if slide_count is None:
+        slide_count = len(slides_content)
     
     # Create the PDF document
     doc = SimpleDocTemplate(
@@ -75,50 +226,19 @@ def create_pdf_from_content(slides_content, original_filename):
         bottomMargin=inch
     )
     
-    # Define styles
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        textColor='#1a365d'
-    )
-    
-    slide_title_style = ParagraphStyle(
-        'SlideTitle',
-        parent=styles['Heading2'],
-        fontSize=16,
-        spaceBefore=20,
-        spaceAfter=12,
-        textColor='#2d3748',
-        borderWidth=0,
-        borderPadding=0,
-        borderColor='#e2e8f0',
-        backColor='#f7fafc'
-    )
-    
-    content_style = ParagraphStyle(
-        'ContentStyle',
-        parent=styles['Normal'],
-        fontSize=11,
-        spaceBefore=6,
-        spaceAfter=6,
-        leftIndent=20,
-        textColor='#4a5568'
-    )
+    styles = get_pdf_styles()
+    title_style = styles['title']
+    slide_title_style = styles['slide_title']
+    content_style = styles['content']
     
     # Build the document content
     story = []
     
     # Document title
-    doc_title = original_filename.replace('.pptx', '').replace('_', ' ').title()
-    story.append(Paragraph(f"📄 {doc_title}", title_style))
-    story.append(Paragraph(f"Generated on: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC", styles['Normal']))
-    story.append(Paragraph(f"Total Slides: {len(slides_content)}", styles['Normal']))
+    safe_title = title.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    story.append(Paragraph(f"📄 {safe_title}", title_style))
+    story.append(Paragraph(f"Generated on: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC", styles['normal']))
+    story.append(Paragraph(f"Total Slides: {slide_count}", styles['normal']))
     story.append(Spacer(1, 30))
     
     # Add each slide's content
@@ -138,117 +258,448 @@ def create_pdf_from_content(slides_content, original_filename):
         
         story.append(Spacer(1, 15))
     
-    # Build PDF
+    # Build PDF (written straight to `buffer`, which may be a file on disk)
     doc.build(story)
     
-    buffer.seek(0)
+    if hasattr(buffer, 'seek'):
+        buffer.seek(0)
     return buffer
 
-def lambda_handler(event, context):
+def conversion_workers(record_count):
     """
-    Main Lambda handler - processes PPTX files and generates PDF summaries.
+    Size the worker pool to the Lambda's memory and CPU.
     
-    Triggered by S3 ObjectCreated events in the 'pptxs/' prefix.
+    Each in-flight conversion is budgeted MEMORY_PER_CONVERSION_MB of the
+    function's memory; Lambda allocates vCPUs in proportion to memory.
     """
-    print("🚀 Converter Lambda triggered")
-    print(f"Event: {json.dumps(event, indent=2)}")
-    
+    memory_mb = int(os.environ.get('AWS_LAMBDA_FUNCTION_MEMORY_SIZE', '1024'))
+    per_conversion_mb = int(os.environ.get('MEMORY_PER_CONVERSION_MB', '512'))
+    by_memory = max(1, memory_mb // per_conversion_mb)
+    by_cpu = os.cpu_count() or 1
+    return max(1, min(record_count, by_memory, by_cpu))
+
+def read_json_object(bucket_name, key):
+    """Return the parsed JSON object at `key`, or None if it does not exist."""
     try:
-        # Get bucket and key from S3 event
-        record = event['Records'][0]
-        bucket_name = record['s3']['bucket']['name']
-        object_key = record['s3']['object']['key']
-        object_key = unquote_plus(object_key)
+        response = s3_client.get_object(Bucket=bucket_name, Key=key)
+    except ClientError as e:
+        if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+            return None
+        raise
+    return json.loads(response['Body'].read().decode('utf-8'))
 
+def object_exists(bucket_name, key):
+    try:
+        s3_client.head_object(Bucket=bucket_name, Key=key)
+        return True
+    except ClientError as e:
+        if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+            return False
+        raise
+
+def cached_outputs_current(bucket_name, cached, etag):
+    """True if the document a cache pointer refers to was last converted from `etag`."""
+    owner_key = cached.get('metadata_path') or \
+        f"metadata/{os.path.basename(cached['pdf_path'])[:-len('.pdf')]}.json"
+    owner = read_json_object(bucket_name, owner_key)
+    return bool(owner) and owner.get('source_etag') == etag and object_exists(bucket_name, cached['pdf_path'])
+
+def slide_hash(slide_data, image_sha1=None):
+    """
+    Short content hash of a slide's extracted title and text, plus the SHA1 of
+    its thumbnail image when thumbnails are produced.
+    """
+    parts = [slide_data['title'], slide_data['content']]
+    if image_sha1:
+        parts.append(image_sha1)
+    payload = json.dumps(parts, ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+def normalize_search_text(text):
+    """
+    NFKD-decompose, drop combining marks and lowercase, so 'İstanbul' and
+    'Şehir' index as 'istanbul' and 'sehir'. Must match the page script's
+    normalize() in dashboard_lambda.py.
+    """
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in decomposed if not unicodedata.category(char).startswith('M')).lower()
+
+def extract_search_terms(slides_content, original_filename):
+    """
+    Distinct lowercase words of the file name and slide text, in order of
+    first appearance, for the dashboard's search index.
+    
+    Beyond MAX_SEARCH_TERMS the most frequent words are dropped: they are
+    the deck's stop-words ('the', 've', ...) and match nearly every document,
+    while rare words are what makes a document findable. File name words are
+    always kept.
+    """
+    def terms_of(text):
+        return [term for term in TERM_PATTERN.findall(normalize_search_text(text))
+                if len(term) >= MIN_TERM_LENGTH and not term.isdigit()]
+    
+    name_terms = dict.fromkeys(terms_of(original_filename.rsplit('.', 1)[0].replace('_', ' ')))
+    counts = Counter(terms_of(' '.join(
+        [slide_data['title'] for slide_data in slides_content]
+        + [line for slide_data in slides_content for line in slide_data['content']]
+    )))
+    budget = max(MAX_SEARCH_TERMS - len(name_terms), 0)
+    # Counter keeps first-appearance order, so ties drop the later word first
+    rarest = set(sorted((term for term in counts if term not in name_terms), key=counts.get)[:budget])
+    return list(name_terms) + [term for term in counts if term in rarest]
+
+def write_metadata(bucket_name, metadata_key, metadata):
+    print(f"📤 Uploading metadata to: {metadata_key}")
+    s3_client.put_object(
+        Bucket=bucket_name,
+        Key=metadata_key,
+        Body=json.dumps(metadata, indent=2),
+        ContentType='application/json'
+    )
+
+def output_keys(base_name):
+    """S3 keys for the single-object output formats of a document."""
+    return {
+        'pdf': f"pdfs/{base_name}.pdf",
+        'markdown': f"text/{base_name}.md",
+        'outline': f"outlines/{base_name}.json"
+    }
+
+def thumbnail_key(base_name, filename):
+    return f"thumbnails/{base_name}/{filename}"
+
+def render_named_outputs(slides_content, original_filename, keys):
+    """
+    (key, body, content_type) uploads for the configured outputs that embed
+    the file name (Markdown, outline).
+    """
+    uploads = []
+    if 'markdown' in OUTPUT_FORMATS:
+        uploads.append((keys['markdown'],
+                        create_markdown_from_content(slides_content, original_filename).encode('utf-8'),
+                        'text/markdown; charset=utf-8'))
+    if 'outline' in OUTPUT_FORMATS:
+        uploads.append((keys['outline'],
+                        create_outline_from_content(slides_content, original_filename).encode('utf-8'),
+                        'application/json'))
+    return uploads
+
+def create_markdown_from_content(slides_content, original_filename):
+    """Plain-text/Markdown rendering of the slides for search indexing."""
+    doc_title = original_filename.replace('.pptx', '').replace('_', ' ').title()
+    lines = [f"# {doc_title}", ""]
+    for slide_data in slides_content:
+        lines.append(f"## Slide {slide_data['slide_number']}: {slide_data['title']}")
+        lines.append("")
+        lines.extend(f"- {text}" for text in slide_data['content'])
+        lines.append("")
+    return "\n".join(lines)
+
+def create_outline_from_content(slides_content, original_filename):
+    """Compact JSON outline of the slides."""
+    return json.dumps({
+        'document': original_filename,
+        'slide_count': len(slides_content),
+        'slides': slides_content
+    }, ensure_ascii=False, separators=(',', ':'))
+
+def extract_slide_images(presentation):
+    """
+    Return (slide_number, ext, blob, sha1) for the first embedded picture of
+    each slide, used as a lightweight slide thumbnail.
+    """
+    images = []
+    for idx, slide in enumerate(presentation.slides, start=1):
+        for shape in slide.shapes:
+            if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+                images.append((idx, shape.image.ext, shape.image.blob, shape.image.sha1))
+                break
+    return images
+
+def upload_outputs(bucket_name, uploads):
+    """
+    Upload all outputs concurrently. Each upload is (key, source, content_type)
+    where source is a local file path (str) or the object body (str/bytes).
+    """
+    def upload(item):
+        key, source, content_type = item
+        print(f"📤 Uploading: {key}")
+        if isinstance(source, str) and os.path.isfile(source):
+            s3_client.upload_file(source, bucket_name, key,
+                                  ExtraArgs={'ContentType': content_type}, Config=TRANSFER_CONFIG)
+        else:
+            s3_client.put_object(Bucket=bucket_name, Key=key, Body=source, ContentType=content_type)
+    
+    if not uploads:
+        return
+    with ThreadPoolExecutor(max_workers=min(len(uploads), 8)) as executor:
+        # list() re-raises the first upload error, if any
+        list(executor.map(upload, uploads))
+
+def copy_outputs(bucket_name, cached_outputs, base_name):
+    """
+    Copy a cached conversion's name-independent outputs (PDF, thumbnails) to
+    the keys of a new document name. Markdown and the outline contain the
+    file name and are re-rendered by the caller instead.
+    """
+    keys = output_keys(base_name)
+    cached_outputs = {fmt: source for fmt, source in cached_outputs.items() if fmt in COPYABLE_OUTPUTS}
+    copies = []
+    for fmt, source in cached_outputs.items():
+        if fmt == 'thumbnails':
+            copies.extend((key, thumbnail_key(base_name, os.path.basename(key))) for key in source)
+        else:
+            copies.append((source, keys[fmt]))
+    
+    def copy(item):
+        source, target = item
+        s3_client.copy_object(Bucket=bucket_name, Key=target,
+                              CopySource={'Bucket': bucket_name, 'Key': source})
+    
+    with ThreadPoolExecutor(max_workers=min(len(copies), 8) or 1) as executor:
+        list(executor.map(copy, copies))
+    
+    outputs = {fmt: keys[fmt] for fmt in cached_outputs if fmt in keys}
+    if 'thumbnails' in cached_outputs:
+        outputs['thumbnails'] = [thumbnail_key(base_name, os.path.basename(key))
+                                 for key in cached_outputs['thumbnails']]
+    return outputs
+
+def convert_pptx(bucket_name, object_key, etag=None):
+    """
+    Convert a single PPTX object into the configured output formats (PDF,
+    Markdown text, JSON outline, thumbnails) plus a metadata JSON.
+    
+    The deck is parsed once and every output is built from that single parse.
+    Conversions are cached by the source object's ETag: re-uploading an
+    identical deck is a no-op, and the same content under another name is
+    served by copying the existing PDF and thumbnails and re-rendering the
+    name-bearing outputs from the cached outline (no download or parse). When the ETag changes but every
+    slide's extracted text (and thumbnail image) hashes the same, the existing
+    outputs are kept.
+    """
+    print(f"📁 Processing: s3://{bucket_name}/{object_key}")
+    
+    # Validate file extension
+    if not object_key.lower().endswith('.pptx'):
+        print(f"⚠️ Skipping non-PPTX file: {object_key}")
+        return {'source_path': object_key, 'skipped': True, 'message': 'Skipped: Not a PPTX file'}
+    
+    original_filename = os.path.basename(object_key)
+    base_name = original_filename.replace('.pptx', '').replace('.PPTX', '')
+    keys = output_keys(base_name)
+    pdf_key = keys['pdf']
+    metadata_key = f"metadata/{base_name}.json"
+    
+    previous = None
+    if CACHE_ENABLED:
+        if not etag:
+            etag = s3_client.head_object(Bucket=bucket_name, Key=object_key)['ETag']
+        etag = etag.strip('"')
         
-        print(f"📁 Processing: s3://{bucket_name}/{object_key}")
-        
-        # Validate file extension
-        if not object_key.lower().endswith('.pptx'):
-            print(f"⚠️ Skipping non-PPTX file: {object_key}")
-            return {
-                'statusCode': 200,
-                'body': json.dumps('Skipped: Not a PPTX file')
-            }
-        
-        # Download PPTX from S3
-        print("📥 Downloading PPTX from S3...")
-        response = s3_client.get_object(Bucket=bucket_name, Key=object_key)
-        pptx_content = response['Body'].read()
-        
-        # Parse PPTX
-        print("📊 Parsing PPTX content...")
-        pptx_buffer = BytesIO(pptx_content)
-        presentation = Presentation(pptx_buffer)
+        # Same object re-uploaded unchanged: nothing to do
+        previous = read_json_object(bucket_name, metadata_key)
+        if previous and previous.get('source_etag') == etag and object_exists(bucket_name, pdf_key):
+            print(f"⚡ Unchanged source (ETag {etag}), skipping: {object_key}")
+            return {'source_path': object_key, 'pdf_path': pdf_key, 'metadata_path': metadata_key,
+                    'slide_count': previous.get('slide_count', 0), 'cached': 'unchanged'}
         
-        # Extract content from all slides
-        slides_content = []
-        for idx, slide in enumerate(presentation.slides, start=1):
-            slide_data = extract_slide_content(slide, idx)
-            slides_content.append(slide_data)
-            print(f"  ✅ Processed slide {idx}: {slide_data['title']}")
+        # Same content already converted under another name: copy its PDF and
+        # thumbnails, and rebuild everything that embeds the file name (Markdown,
+        # outline, search terms) from the cached outline's slides. The pointer
+        # names another document's (mutable) output keys, so only trust it while
+        # that document's metadata still records this ETag.
+        cached = read_json_object(bucket_name, f"{CACHE_PREFIX}{etag}.json")
+        cached_outputs = (cached or {}).get('outputs') or {}
+        outline = None
+        if cached and cached['pdf_path'] != pdf_key and cached_outputs.get('outline') \
+                and cached_outputs_current(bucket_name, cached, etag):
+            outline = read_json_object(bucket_name, cached_outputs['outline'])
+        if outline:
+            print(f"⚡ Content cache hit (ETag {etag}), copying outputs of {cached['pdf_path']}")
+            slides_content = outline['slides']
+            outputs = copy_outputs(bucket_name, cached_outputs, base_name)
+            uploads = render_named_outputs(slides_content, original_filename, keys)
+            upload_outputs(bucket_name, uploads)
+            outputs.update((fmt, key) for fmt, key in keys.items() if key in {upload[0] for upload in uploads})
+            write_metadata(bucket_name, metadata_key, {
+                'pdf_name': f"{base_name}.pdf",
+                'original_name': original_filename,
+                'slide_count': cached['slide_count'],
+                'create_date': datetime.utcnow().isoformat() + 'Z',
+                'pdf_path': pdf_key,
+                'source_path': object_key,
+                'outputs': outputs,
+                'source_etag': etag,
+                'slide_hashes': cached.get('slide_hashes', []),
+                'search_terms': extract_search_terms(slides_content, original_filename)
+            })
+            return {'source_path': object_key, 'pdf_path': pdf_key, 'metadata_path': metadata_key,
+                    'slide_count': cached['slide_count'], 'cached': 'copied'}
+    
+    pptx_fd, pptx_path = tempfile.mkstemp(suffix='.pptx', dir=SPOOL_DIR)
+    pdf_fd, pdf_path = tempfile.mkstemp(suffix='.pdf', dir=SPOOL_DIR)
+    os.close(pptx_fd)
+    os.close(pdf_fd)
+    
+    try:
+        # Download PPTX from S3 straight to local disk
+        print(f"📥 Downloading PPTX from S3: {object_key}")
+        s3_client.download_file(bucket_name, object_key, pptx_path, Config=TRANSFER_CONFIG)
         
+        # Parse PPTX once and extract text (small compared to the deck itself)
+        print(f"📊 Parsing PPTX content: {object_key}")
+        presentation = Presentation(pptx_path)
+        slides_content = extract_slides(pptx_path, presentation)
+        images = extract_slide_images(presentation) if 'thumbnails' in OUTPUT_FORMATS else []
+        del presentation
         slide_count = len(slides_content)
+        image_hashes = {slide_number: sha1 for slide_number, _, _, sha1 in images}
+        slide_hashes = [slide_hash(slide_data, image_hashes.get(slide_data['slide_number']))
+                        for slide_data in slides_content]
+        search_terms = extract_search_terms(slides_content, original_filename)
         print(f"📄 Total slides extracted: {slide_count}")
         
-        # Generate PDF
-        print("🔄 Generating PDF...")
-        original_filename = os.path.basename(object_key)
-        pdf_buffer = create_pdf_from_content(slides_content, original_filename)
-        
-        # Prepare output paths
-        base_name = original_filename.replace('.pptx', '').replace('.PPTX', '')
-        pdf_key = f"pdfs/{base_name}.pdf"
-        metadata_key = f"metadata/{base_name}.json"
-        
-        # Upload PDF to S3
-        print(f"📤 Uploading PDF to: {pdf_key}")
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key=pdf_key,
-            Body=pdf_buffer.getvalue(),
-            ContentType='application/pdf'
-        )
-        
-        # Create and upload metadata JSON
-        metadata = {
-            'pdf_name': f"{base_name}.pdf",
-            'original_name': original_filename,
-            'slide_count': slide_count,
-            'create_date': datetime.utcnow().isoformat() + 'Z',
-            'pdf_path': pdf_key,
-            'source_path': object_key
-        }
+        previous_hashes = (previous or {}).get('slide_hashes')
+        changed_slides = [
+            idx for idx, digest in enumerate(slide_hashes, start=1)
+            if not previous_hashes or idx > len(previous_hashes) or previous_hashes[idx - 1] != digest
+        ]
         
-        print(f"📤 Uploading metadata to: {metadata_key}")
+        if previous_hashes == slide_hashes and previous.get('outputs') and object_exists(bucket_name, pdf_key):
+            # Outputs only depend on slide text (and thumbnail images, which are
+            # part of the hash), so identical hashes mean identical outputs
+            print(f"⚡ Slide content unchanged, keeping existing outputs: {pdf_key}")
+            outputs = previous['outputs']
+            rendered = False
+        else:
+            if previous_hashes:
+                print(f"🔄 Changed slides: {changed_slides or 'removed slides only'}")
+            
+            uploads = []
+            if 'pdf' in OUTPUT_FORMATS:
+                print(f"🔄 Generating PDF from {slide_count} slides...")
+                create_pdf_from_content(slides_content, deck_title(slides_content), output=pdf_path)
+                uploads.append((keys['pdf'], pdf_path, 'application/pdf'))
+            uploads.extend(render_named_outputs(slides_content, original_filename, keys))
+            uploaded = {upload[0] for upload in uploads}
+            outputs = {fmt: key for fmt, key in keys.items() if key in uploaded}
+            if images:
+                thumbnails = []
+                for slide_number, ext, blob, _ in images:
+                    key = thumbnail_key(base_name, f"slide-{slide_number}.{ext}")
+                    uploads.append((key, blob, f"image/{'jpeg' if ext == 'jpg' else ext}"))
+                    thumbnails.append(key)
+                outputs['thumbnails'] = thumbnails
+            
+            # Upload every output concurrently (PDF as multipart for large files)
+            upload_outputs(bucket_name, uploads)
+            rendered = True
+    finally:
+        for path in (pptx_path, pdf_path):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    # Create and upload metadata JSON (written last: it triggers the dashboard)
+    metadata = {
+        'pdf_name': f"{base_name}.pdf",
+        'original_name': original_filename,
+        'slide_count': slide_count,
+        'create_date': datetime.utcnow().isoformat() + 'Z',
+        'pdf_path': pdf_key,
+        'source_path': object_key,
+        'outputs': outputs,
+        'search_terms': search_terms
+    }
+    if CACHE_ENABLED:
+        metadata['source_etag'] = etag
+        metadata['slide_hashes'] = slide_hashes
+        metadata['changed_slides'] = changed_slides
         s3_client.put_object(
             Bucket=bucket_name,
-            Key=metadata_key,
-            Body=json.dumps(metadata, indent=2),
+            Key=f"{CACHE_PREFIX}{etag}.json",
+            Body=json.dumps({'pdf_path': pdf_key, 'metadata_path': metadata_key, 'slide_count': slide_count,
+                             'slide_hashes': slide_hashes, 'outputs': outputs}),
             ContentType='application/json'
         )
-        
-        print("✅ Conversion completed successfully!")
-        
-        return {
-            'statusCode': 200,
-            'body': json.dumps({
-                'message': 'PPTX converted successfully',
-                'pdf_path': pdf_key,
-                'metadata_path': metadata_key,
-                'slide_count': slide_count
-            })
-        }
-        
+    write_metadata(bucket_name, metadata_key, metadata)
+    
+    print(f"✅ Converted: {object_key}")
+    result = {
+        'source_path': object_key,
+        'pdf_path': pdf_key,
+        'metadata_path': metadata_key,
+        'slide_count': slide_count,
+        'outputs': outputs
+    }
+    if not rendered:
+        result['cached'] = 'slides_unchanged'
+    return result
+
+def lambda_handler(event, context):
+    """
+    Main Lambda handler - processes PPTX files and generates PDF summaries.
+    
+    Triggered by S3 ObjectCreated events in the 'pptxs/' prefix. Every record in
+    the event is converted; records run concurrently and fail independently.
+    """
+    print("🚀 Converter Lambda triggered")
+    print(f"Event: {json.dumps(event, indent=2)}")
+    
+    try:
+        records = [
+            (
+                record['s3']['bucket']['name'],
+                unquote_plus(record['s3']['object']['key']),
+                record['s3']['object'].get('eTag')
+            )
+            for record in event['Records']
+        ]
     except Exception as e:
-        print(f"❌ Error processing PPTX: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        
+        print(f"❌ Invalid S3 event: {str(e)}")
         return {
-            'statusCode': 500,
+            'statusCode': 400,
             'body': json.dumps({
                 'error': str(e),
                 'message': 'Failed to convert PPTX'
             })
         }
+    
+    workers = conversion_workers(len(records))
+    print(f"📦 Converting {len(records)} record(s) with {workers} worker(s)")
+    
+    results = []
+    failures = []
+    # Threads, not processes: Lambda has no /dev/shm for multiprocessing pools,
+    # and S3 transfers release the GIL while waiting on the network.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(convert_pptx, bucket, key, etag) for bucket, key, etag in records]
+        for (bucket, key, etag), future in zip(records, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"❌ Error processing {key}: {str(e)}")
+                traceback.print_exc()
+                results.append({'source_path': key, 'error': str(e)})
+                failures.append({'itemIdentifier': key})
+    
+    converted = [result for result in results if 'pdf_path' in result]
+    if not failures:
+        status_code = 200
+    elif converted:
+        status_code = 207
+    else:
+        status_code = 500
+    
+    print(f"✅ Batch completed: {len(converted)} converted, {len(failures)} failed")
+    
+    return {
+        'statusCode': status_code,
+        'body': json.dumps({
+            'message': 'PPTX batch processed' if failures else 'PPTX converted successfully',
+            'converted': len(converted),
+            'failed': len(failures),
+            'results': results
+        }),
+        'batchItemFailures': failures
+    }
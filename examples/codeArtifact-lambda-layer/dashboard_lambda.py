@@ -2,19 +2,60 @@
 Dashboard Generator Lambda Function
 ====================================
 Triggered by S3 .json creation in the 'metadata/' prefix.
-Scans all metadata files and generates a Tailwind CSS styled dashboard.
+Keeps an aggregate manifest of all documents up to date from the triggering
+metadata files and generates a paginated, gzip pre-compressed Tailwind CSS
+styled dashboard from it.
 """
 
+import gzip
+import hashlib
 import json
 import os
+import re
+import unicodedata
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from html import escape
+from urllib.parse import unquote_plus
 import time
 
-# Initialize S3 client
-s3_client = boto3.client('s3')
+# Metadata GETs issued in parallel during a full rebuild
+RECONCILE_WORKERS = int(os.environ.get('RECONCILE_WORKERS', '32'))
+
+# Initialize S3 client (connection pool sized for the rebuild workers)
+s3_client = boto3.client('s3', config=Config(max_pool_connections=RECONCILE_WORKERS))
 cf_client = boto3.client('cloudfront')
 
+METADATA_PREFIX = 'metadata/'
+# Aggregate index of every document; kept outside metadata/ so writing it
+# does not re-trigger this function
+MANIFEST_KEY = os.environ.get('MANIFEST_KEY', 'dashboard/manifest.json')
+# Full metadata/ rescan at most this often (also forced by scheduled events)
+RECONCILE_INTERVAL_SECONDS = int(os.environ.get('RECONCILE_INTERVAL_SECONDS', str(24 * 3600)))
+MANIFEST_MAX_RETRIES = 5
+# Documents per dashboard page; older pages live under pages/, their
+# compact row data under dashboard/data/
+PAGE_SIZE = int(os.environ.get('PAGE_SIZE', '100'))
+PAGES_PREFIX = 'pages/'
+DATA_PREFIX = 'dashboard/data/'
+# Inverted index for client-side search: search/docs.json plus one
+# term -> document ids shard per first character of the term
+SEARCH_PREFIX = 'search/'
+TERM_PATTERN = re.compile(r'\w+')
+ROW_FIELDS = ['document_name', 'original_name', 'slide_count', 'create_date', 'pdf_path']
+# CloudFront invalidations are issued at most once per window; pages are
+# served with max-age=60, so a debounced path is never stale for longer
+INVALIDATION_DEBOUNCE_SECONDS = int(os.environ.get('INVALIDATION_DEBOUNCE_SECONDS', '60'))
+INVALIDATION_MAX_PATHS = 15
+METRICS_NAMESPACE = 'PPTXConverter/Dashboard'
+# Metadata fields stored in the manifest
+DOCUMENT_FIELDS = ('pdf_name', 'original_name', 'slide_count', 'create_date', 'pdf_path', 'search_terms')
+
 # Tailwind CSS Dashboard Template
 HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
@@ -65,6 +106,49 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
     <!-- Main Content -->
     <main class="px-4 pb-12">
         <div class="max-w-6xl mx-auto">
+            {stats_cards}
+
+            <!-- Documents Table -->
+            <div class="glass-card rounded-2xl shadow-xl overflow-hidden fade-in" style="animation-delay: 0.4s;">
+                <div class="px-6 py-4 border-b border-gray-100 flex flex-col md:flex-row md:items-center md:justify-between gap-3">
+                    <h2 class="text-xl font-semibold text-gray-800">Converted Documents <span id="page-label" class="text-sm font-normal text-gray-400">• {page_label}</span></h2>
+                    <input id="search-input" type="search" placeholder="Search documents and slide text..." autocomplete="off"
+                           class="w-full md:w-72 px-4 py-2 rounded-lg border border-gray-200 text-sm focus:outline-none focus:ring-2 focus:ring-purple-400">
+                </div>
+                <div class="overflow-x-auto">
+                    <table class="w-full">
+                        <thead>
+                            <tr class="bg-gray-50/50">
+                                <th class="px-6 py-4 text-left text-xs font-semibold text-gray-500 uppercase tracking-wider">Document Name</th>
+                                <th class="px-6 py-4 text-center text-xs font-semibold text-gray-500 uppercase tracking-wider">Slides</th>
+                                <th class="px-6 py-4 text-center text-xs font-semibold text-gray-500 uppercase tracking-wider">Date</th>
+                                <th class="px-6 py-4 text-center text-xs font-semibold text-gray-500 uppercase tracking-wider">Action</th>
+                            </tr>
+                        </thead>
+                        <tbody id="document-rows" data-page="{page_number}" class="divide-y divide-gray-100">
+                            {table_rows}
+                        </tbody>
+                    </table>
+                </div>
+                {empty_state}
+                {pagination}
+            </div>
+
+            <!-- Footer -->
+            <div class="mt-8 text-center">
+                <p class="text-white/60 text-sm">
+                    Powered by AWS Lambda • CloudFront • S3
+                </p>
+            </div>
+        </div>
+    </main>
+    <template id="row-template">{row_template}</template>
+    <script>{page_script}</script>
+</body>
+</html>'''
+
+# Stats cards (only on the newest page, index.html)
+STATS_TEMPLATE = '''
             <!-- Stats Cards -->
             <div class="grid grid-cols-1 md:grid-cols-3 gap-6 mb-8">
                 <div class="glass-card rounded-2xl p-6 shadow-xl fade-in" style="animation-delay: 0.1s;">
@@ -107,40 +191,7 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
                     </div>
                 </div>
             </div>
-
-            <!-- Documents Table -->
-            <div class="glass-card rounded-2xl shadow-xl overflow-hidden fade-in" style="animation-delay: 0.4s;">
-                <div class="px-6 py-4 border-b border-gray-100">
-                    <h2 class="text-xl font-semibold text-gray-800">Converted Documents</h2>
-                </div>
-                <div class="overflow-x-auto">
-                    <table class="w-full">
-                        <thead>
-                            <tr class="bg-gray-50/50">
-                                <th class="px-6 py-4 text-left text-xs font-semibold text-gray-500 uppercase tracking-wider">Document Name</th>
-                                <th class="px-6 py-4 text-center text-xs font-semibold text-gray-500 uppercase tracking-wider">Slides</th>
-                                <th class="px-6 py-4 text-center text-xs font-semibold text-gray-500 uppercase tracking-wider">Date</th>
-                                <th class="px-6 py-4 text-center text-xs font-semibold text-gray-500 uppercase tracking-wider">Action</th>
-                            </tr>
-                        </thead>
-                        <tbody class="divide-y divide-gray-100">
-                            {table_rows}
-                        </tbody>
-                    </table>
-                </div>
-                {empty_state}
-            </div>
-
-            <!-- Footer -->
-            <div class="mt-8 text-center">
-                <p class="text-white/60 text-sm">
-                    Powered by AWS Lambda • CloudFront • S3
-                </p>
-            </div>
-        </div>
-    </main>
-</body>
-</html>'''
+'''
 
 # Table row template
 TABLE_ROW_TEMPLATE = '''
@@ -153,19 +204,19 @@ TABLE_ROW_TEMPLATE = '''
                                             </svg>
                                         </div>
                                         <div>
-                                            <p class="font-medium text-gray-800">{document_name}</p>
-                                            <p class="text-xs text-gray-400">{original_name}</p>
+                                            <p class="font-medium text-gray-800" data-field="document_name">{document_name}</p>
+                                            <p class="text-xs text-gray-400" data-field="original_name">{original_name}</p>
                                         </div>
                                     </div>
                                 </td>
                                 <td class="px-6 py-4 text-center">
-                                    <span class="inline-flex items-center px-3 py-1 rounded-full text-sm font-medium bg-purple-100 text-purple-800">
+                                    <span class="inline-flex items-center px-3 py-1 rounded-full text-sm font-medium bg-purple-100 text-purple-800" data-field="slide_count">
                                         {slide_count} slides
                                     </span>
                                 </td>
-                                <td class="px-6 py-4 text-center text-sm text-gray-600">{create_date}</td>
+                                <td class="px-6 py-4 text-center text-sm text-gray-600" data-field="create_date">{create_date}</td>
                                 <td class="px-6 py-4 text-center">
-                                    <a href="{pdf_path}" download 
+                                    <a href="{pdf_path}" data-field="pdf_path" download 
                                        class="inline-flex items-center px-4 py-2 rounded-lg bg-gradient-to-r from-blue-500 to-purple-600 text-white text-sm font-medium hover:from-blue-600 hover:to-purple-700 transition-all duration-200 shadow-md hover:shadow-lg">
                                         <svg class="w-4 h-4 mr-2" fill="none" stroke="currentColor" viewBox="0 0 24 24">
                                             <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M4 16v1a3 3 0 003 3h10a3 3 0 003-3v-1m-4-4l-4 4m0 0l-4-4m4 4V4"></path>
@@ -187,6 +238,143 @@ EMPTY_STATE_TEMPLATE = '''
                     <p class="text-gray-500">Upload a PPTX file to the pptxs/ folder to get started.</p>
                 </div>'''
 
+# Row markup cloned by the page script when rendering rows client-side
+ROW_TEMPLATE_EMPTY = TABLE_ROW_TEMPLATE.format(
+    document_name='', original_name='', slide_count='', create_date='', pdf_path='#'
+)
+
+# Older/newer page links (absolute so they work from index.html and pages/)
+PAGINATION_TEMPLATE = '''
+                <nav id="page-nav" class="px-6 py-4 border-t border-gray-100 flex justify-between text-sm font-medium">
+                    <a id="page-newer" href="{newer_href}" data-page="{newer_page}" class="text-purple-600 hover:text-purple-800 {newer_hidden}">&larr; Newer</a>
+                    <a id="page-older" href="{older_href}" data-page="{older_page}" class="text-purple-600 hover:text-purple-800 {older_hidden}">Older &rarr;</a>
+                </nav>'''
+
+# Client-side paging and search: swaps the table rows from the compact page
+# JSON instead of reloading the full HTML page (falls back to the static page
+# on error), and answers prefix searches from the sharded search index
+PAGE_SCRIPT = '''
+(function () {
+    var rows = document.getElementById('document-rows');
+    var template = document.getElementById('row-template');
+    var label = document.getElementById('page-label');
+    var nav = document.getElementById('page-nav');
+    var currentPage = rows.dataset.page;
+    // index.html may span two pages (data-page is empty); keep its rows to restore after a search
+    var initialRows = Array.prototype.slice.call(rows.children);
+    var initialLabel = label.textContent;
+    var cache = {};
+    function getJSON(url) {
+        if (!cache[url]) {
+            cache[url] = fetch(url).then(function (response) {
+                if (!response.ok) throw new Error(response.status);
+                return response.json();
+            });
+        }
+        return cache[url];
+    }
+    function setLink(link, page) {
+        link.classList.toggle('invisible', !page);
+        link.dataset.page = page || '';
+        link.href = page ? '/pages/' + page + '.html' : '#';
+    }
+    function renderRows(fields, data) {
+        var fragment = document.createDocumentFragment();
+        data.forEach(function (row) {
+            var node = template.content.cloneNode(true);
+            node.querySelectorAll('[data-field]').forEach(function (el) {
+                var value = row[fields.indexOf(el.dataset.field)];
+                if (el.dataset.field === 'pdf_path') el.href = value;
+                else if (el.dataset.field === 'slide_count') el.textContent = value + ' slides';
+                else el.textContent = value;
+            });
+            fragment.appendChild(node);
+        });
+        rows.replaceChildren(fragment);
+    }
+    function render(data) {
+        renderRows(data.fields, data.rows);
+        currentPage = data.page;
+        label.textContent = '• Page ' + data.page;
+        nav.classList.remove('hidden');
+        setLink(document.getElementById('page-newer'), data.newer);
+        setLink(document.getElementById('page-older'), data.older);
+    }
+    function load(page, push) {
+        return fetch('/dashboard/data/page-' + page + '.json')
+            .then(function (response) {
+                if (!response.ok) throw new Error(response.status);
+                return response.json();
+            })
+            .then(function (data) {
+                render(data);
+                if (push) history.pushState({page: page}, '', '/pages/' + page + '.html');
+            });
+    }
+    // Must match normalize_search_text() in dashboard_lambda.py
+    function normalize(text) {
+        return text.normalize('NFKD').replace(/\\p{M}/gu, '').toLowerCase();
+    }
+    // Must match shard_name() in dashboard_lambda.py
+    function shardName(term) {
+        var c = String.fromCodePoint(term.codePointAt(0));
+        if (/^[a-z0-9]$/.test(c)) return c;
+        var hex = c.codePointAt(0).toString(16);
+        return 'u' + ('0000' + hex).slice(-Math.max(4, hex.length));
+    }
+    function matchTerm(term) {
+        return getJSON('/search/' + shardName(term) + '.json').then(function (shard) {
+            var ids = {};
+            Object.keys(shard).forEach(function (candidate) {
+                if (candidate.lastIndexOf(term, 0) === 0) {
+                    shard[candidate].forEach(function (id) { ids[id] = true; });
+                }
+            });
+            return ids;
+        }, function () { return {}; });
+    }
+    function restore() {
+        if (currentPage) return load(currentPage, false);
+        rows.replaceChildren.apply(rows, initialRows);
+        label.textContent = initialLabel;
+        nav.classList.remove('hidden');
+        return Promise.resolve();
+    }
+    function search(query) {
+        var terms = normalize(query).match(/[\\p{L}\\p{N}_]+/gu) || [];
+        if (!terms.length) return restore();
+        return Promise.all([getJSON('/search/docs.json')].concat(terms.map(matchTerm)))
+            .then(function (results) {
+                var index = results[0];
+                var matches = results.slice(1);
+                var ids = Object.keys(matches[0]).filter(function (id) {
+                    return matches.every(function (found) { return found[id]; });
+                }).map(Number).sort(function (a, b) { return b - a; });
+                renderRows(index.fields, ids.slice(0, 200).map(function (id) { return index.rows[id]; })
+                    .filter(Boolean));
+                label.textContent = '• ' + ids.length + ' result(s)';
+                nav.classList.add('hidden');
+            });
+    }
+    var timer;
+    document.getElementById('search-input').addEventListener('input', function (event) {
+        clearTimeout(timer);
+        timer = setTimeout(function () { search(event.target.value); }, 150);
+    });
+    document.querySelectorAll('#page-newer, #page-older').forEach(function (link) {
+        link.addEventListener('click', function (event) {
+            if (!link.dataset.page) return;
+            event.preventDefault();
+            load(link.dataset.page, true).catch(function () { window.location = link.href; });
+        });
+    });
+    window.addEventListener('popstate', function (event) {
+        if (event.state && event.state.page) load(event.state.page, false);
+        else window.location.reload();
+    });
+})();
+'''
+
 
 def format_date(iso_date):
     """Format ISO date string to human-readable format."""
@@ -197,109 +385,666 @@ def format_date(iso_date):
         return iso_date
 
 
+def utc_now_iso():
+    return datetime.utcnow().isoformat() + 'Z'
+
+
+def document_entry(metadata):
+    """Keep only the metadata fields the dashboard renders."""
+    return {field: metadata[field] for field in DOCUMENT_FIELDS if field in metadata}
+
+
+def read_metadata(bucket_name, key):
+    """
+    Fetch and parse a single metadata JSON; None if it is missing or invalid.
+    Any other error (throttling, timeouts, access) is raised, so a transient
+    failure aborts the run instead of dropping the document from the manifest.
+    """
+    try:
+        response = s3_client.get_object(Bucket=bucket_name, Key=key)
+    except ClientError as e:
+        if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+            print(f"  ⚠️ Metadata disappeared: {key}")
+            return None
+        raise
+    try:
+        return json.loads(response['Body'].read().decode('utf-8'))
+    except ValueError as e:
+        print(f"  ⚠️ Invalid metadata JSON in {key}: {str(e)}")
+        return None
+
+
+def render_rows(documents):
+    """Render table rows with a single join instead of repeated concatenation."""
+    return ''.join([
+        TABLE_ROW_TEMPLATE.format(
+            document_name=escape(doc.get('pdf_name', 'Unknown')),
+            original_name=escape(doc.get('original_name', '')),
+            slide_count=doc.get('slide_count', 0),
+            create_date=format_date(doc.get('create_date', '')),
+            pdf_path=escape(pdf_href(doc))
+        )
+        for doc in documents
+    ])
+
+
+def pdf_href(doc):
+    # Absolute path: rows are rendered both in index.html and in pages/
+    return '/' + doc['pdf_path'] if doc.get('pdf_path') else '#'
+
+
+def page_href(number):
+    return f"/{PAGES_PREFIX}{number}.html"
+
+
+def render_page(documents, number, page_count, stats_cards='', oldest_number=None):
+    """
+    Render one dashboard page. `oldest_number` is set when the rows span
+    several pages (index.html): pages `number` down to `oldest_number`.
+    """
+    oldest_number = oldest_number or number
+    newer = number + 1 if number < page_count else None
+    older = oldest_number - 1 if oldest_number > 1 else None
+    pagination = PAGINATION_TEMPLATE.format(
+        newer_href=page_href(newer) if newer else '#',
+        newer_page=newer or '',
+        newer_hidden='' if newer else 'invisible',
+        older_href=page_href(older) if older else '#',
+        older_page=older or '',
+        older_hidden='' if older else 'invisible'
+    )
+    return HTML_TEMPLATE.format(
+        stats_cards=stats_cards,
+        # The page script only loads single pages, so a spanning page has no number
+        page_number=number if oldest_number == number else '',
+        page_label=f"Page {number}" if oldest_number == number else f"Pages {number}–{oldest_number}",
+        table_rows=render_rows(documents),
+        empty_state='' if documents or stats_cards == '' else EMPTY_STATE_TEMPLATE,
+        pagination=pagination,
+        row_template=ROW_TEMPLATE_EMPTY,
+        page_script=PAGE_SCRIPT
+    )
+
+
+def render_page_data(documents, number, page_count):
+    """Compact JSON for a page: field names once, then one array per document."""
+    return json.dumps({
+        'page': number,
+        'newer': number + 1 if number < page_count else None,
+        'older': number - 1 if number > 1 else None,
+        'fields': ROW_FIELDS,
+        'rows': [document_row(doc) for doc in documents]
+    }, ensure_ascii=False, separators=(',', ':'))
+
+
+def document_row(doc):
+    return [doc.get('pdf_name', 'Unknown'), doc.get('original_name', ''), doc.get('slide_count', 0),
+            format_date(doc.get('create_date', '')), pdf_href(doc)]
+
+
+def normalize_search_text(text):
+    """
+    NFKD-decompose, drop combining marks and lowercase. Matches normalize()
+    in the page script, so 'İstanbul' is one term ('istanbul') on both sides
+    and 'ß' is kept as is rather than case-folded to 'ss'.
+    """
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in decomposed if not unicodedata.category(char).startswith('M')).lower()
+
+
+def shard_name(term):
+    """Search shard for a term: its first character, hex-escaped unless [a-z0-9]."""
+    char = term[0]
+    return char if char.isascii() and char.isalnum() else f"u{ord(char):04x}"
+
+
+def assign_doc_ids(manifest, previous_documents=None):
+    """
+    Give every document a stable search id, kept in its manifest entry as
+    'doc_id'. Entries without one take it from `previous_documents` (the
+    same key before this update) or get the next free id, oldest first; a
+    duplicate left by merging two manifests gets a new one.
+    """
+    documents = manifest['documents']
+    previous_documents = previous_documents or {}
+    next_id = manifest.get('next_doc_id', 0)
+    seen = set()
+    missing = []
+    for key in sorted(documents, key=lambda key: (documents[key].get('create_date', ''), key)):
+        doc = documents[key]
+        if 'doc_id' not in doc and 'doc_id' in previous_documents.get(key, {}):
+            doc['doc_id'] = previous_documents[key]['doc_id']
+        if doc.get('doc_id') is None or doc['doc_id'] in seen:
+            missing.append(doc)
+            continue
+        seen.add(doc['doc_id'])
+        next_id = max(next_id, doc['doc_id'] + 1)
+    for doc in missing:
+        doc['doc_id'] = next_id
+        next_id += 1
+    manifest['next_doc_id'] = next_id
+
+
+def render_search_index(ordered):
+    """
+    Render the search index for documents in manifest order (oldest first).
+    
+    Shards refer to documents by their stable 'doc_id' (see assign_doc_ids),
+    so a new upload or a re-upload only changes docs.json and the shards
+    holding that document's terms; every other shard stays byte-identical
+    and is not rewritten. Terms come from the converter's 'search_terms'
+    plus the file name; both are normalised again here, so terms stored by
+    older converters match too.
+    """
+    shards = defaultdict(lambda: defaultdict(list))
+    for _, doc in ordered:
+        name = doc.get('original_name', '').rsplit('.', 1)[0].replace('_', ' ')
+        text = ' '.join(doc.get('search_terms', []) + [name])
+        terms = set(TERM_PATTERN.findall(normalize_search_text(text)))
+        for term in terms:
+            shards[shard_name(term)][term].append(doc['doc_id'])
+    
+    rendered = {
+        f"{SEARCH_PREFIX}{name}.json": (
+            json.dumps({term: sorted(ids) for term, ids in terms.items()},
+                       ensure_ascii=False, sort_keys=True, separators=(',', ':')), 'application/json')
+        for name, terms in shards.items()
+    }
+    rendered[f"{SEARCH_PREFIX}docs.json"] = (json.dumps({
+        'fields': ROW_FIELDS,
+        'rows': {doc['doc_id']: document_row(doc)
+                 for doc in sorted((doc for _, doc in ordered), key=lambda doc: doc['doc_id'])}
+    }, ensure_ascii=False, separators=(',', ':')), 'application/json')
+    return rendered
+
+
+def render_site(manifest):
+    """
+    Render every dashboard object. Returns (hashes, changed): the content hash
+    of every object, and the objects whose content differs from the hashes
+    recorded in the manifest, as (key, body, content_type).
+    
+    Pages are numbered oldest-first (page 1 holds the oldest documents) so a
+    new upload only changes the newest page and index.html, plus the search
+    shards of the new document's terms. index.html shows the library stats
+    and the newest page; while that page holds fewer than PAGE_SIZE
+    documents, the page before it is shown too, so the landing page never
+    lists just a handful of documents.
+    """
+    ordered = sorted(manifest['documents'].items(),
+                     key=lambda item: (item[1].get('create_date', ''), item[0]))
+    chunks = [
+        [doc for _, doc in reversed(ordered[start:start + PAGE_SIZE])]
+        for start in range(0, len(ordered), PAGE_SIZE)
+    ] or [[]]
+    page_count = len(chunks)
+    
+    rendered = {}
+    for number, documents in enumerate(chunks, start=1):
+        rendered[f"{PAGES_PREFIX}{number}.html"] = (render_page(documents, number, page_count), 'text/html')
+        rendered[f"{DATA_PREFIX}page-{number}.json"] = (
+            render_page_data(documents, number, page_count), 'application/json')
+    
+    stats_cards = STATS_TEMPLATE.format(
+        total_documents=len(ordered),
+        total_slides=sum(doc.get('slide_count', 0) for doc in manifest['documents'].values()),
+        last_updated=datetime.utcnow().strftime('%b %d, %Y %H:%M')
+    )
+    landing, oldest_number = chunks[-1], page_count
+    if len(landing) < PAGE_SIZE and page_count > 1:
+        landing, oldest_number = chunks[-1] + chunks[-2], page_count - 1
+    rendered['index.html'] = (
+        render_page(landing, page_count, page_count, stats_cards, oldest_number), 'text/html')
+    rendered.update(render_search_index(ordered))
+    
+    previous = manifest.get('pages', {})
+    # Shards whose terms all disappeared are emptied rather than left stale
+    for key in previous:
+        if key.startswith(SEARCH_PREFIX) and key not in rendered:
+            rendered[key] = ('{}', 'application/json')
+    hashes = {}
+    changed = []
+    for key, (body, content_type) in rendered.items():
+        data = body.encode('utf-8')
+        hashes[key] = hashlib.sha1(data).hexdigest()[:16]
+        if previous.get(key) != hashes[key]:
+            changed.append((key, data, content_type))
+    manifest['page_count'] = page_count
+    return hashes, changed
+
+
+def upload_site(bucket_name, changed):
+    """Upload the changed objects gzip-compressed, in parallel. Returns the keys that failed."""
+    def upload(item):
+        key, data, content_type = item
+        try:
+            s3_client.put_object(
+                Bucket=bucket_name,
+                Key=key,
+                # mtime=0 keeps the compressed bytes deterministic for identical content
+                Body=gzip.compress(data, compresslevel=9, mtime=0),
+                ContentType=f"{content_type}; charset=utf-8",
+                ContentEncoding='gzip',
+                CacheControl='max-age=60'
+            )
+        except Exception as e:
+            print(f"  ⚠️ Error uploading {key}: {str(e)}")
+            return key
+        return None
+    
+    with ThreadPoolExecutor(max_workers=min(len(changed), RECONCILE_WORKERS) or 1) as executor:
+        return [key for key in executor.map(upload, changed) if key]
+
+
+def publish_site(bucket_name, manifest, timer, written=()):
+    """
+    Render the site from the manifest and upload the objects that changed.
+    
+    Hashes are recorded in manifest['pages'] only for objects that were
+    uploaded; a failed object keeps its previous hash, so the next run
+    writes it again. `written` holds keys uploaded by an earlier attempt of
+    this invocation whose manifest write lost a race: their content may have
+    been overwritten since, so they are compared against nothing and
+    uploaded again. Returns (uploaded keys, failed keys).
+    """
+    previous = manifest.setdefault('pages', {})
+    for key in written:
+        previous.pop(key, None)
+    with timer.phase('render'):
+        hashes, changed = render_site(manifest)
+    print(f"📤 Uploading {len(changed)} changed object(s): {[key for key, _, _ in changed]}")
+    with timer.phase('upload'):
+        failed = upload_site(bucket_name, changed)
+    
+    for key in failed:
+        if key in previous:
+            hashes[key] = previous[key]
+        else:
+            del hashes[key]
+    manifest['pages'] = hashes
+    return [key for key, _, _ in changed if key not in failed], failed
+
+
+def invalidation_paths_for(keys):
+    """CloudFront paths for changed objects, collapsed to wildcards when there are many."""
+    paths = set()
+    for key in keys:
+        paths.add(f"/{key}")
+        if key == 'index.html':
+            paths.add('/')
+    if len(paths) > INVALIDATION_MAX_PATHS:
+        # One wildcard per top-level folder (a wildcard counts as a single path)
+        paths = {path if path.count('/') == 1 else f"/{path.split('/')[1]}/*" for path in paths}
+    if len(paths) > INVALIDATION_MAX_PATHS:
+        paths = {'/*'}
+    return sorted(paths)
+
+
+def plan_invalidation(manifest, changed_keys):
+    """
+    Debounce CloudFront invalidations using the state kept in the manifest.
+    
+    Changed paths accumulate in 'pending_paths'; they are only invalidated
+    if no invalidation was issued in the last INVALIDATION_DEBOUNCE_SECONDS.
+    Paths left pending go stale for at most the pages' max-age, and are
+    included in the next invalidation. Returns the paths to invalidate now,
+    or [] when there is nothing to do or the call is debounced. The pending
+    paths stay recorded until mark_invalidated() confirms the request.
+    """
+    if not os.environ.get('DISTRIBUTION_ID'):
+        return []
+    
+    state = manifest.setdefault('invalidation', {})
+    pending = set(state.get('pending_paths', [])) | {f"/{key}" for key in changed_keys}
+    state['pending_paths'] = sorted(pending)
+    if not pending:
+        return []
+    
+    if time.time() - state.get('last_issued_at', 0) < INVALIDATION_DEBOUNCE_SECONDS:
+        return []
+    return invalidation_paths_for(path[1:] for path in pending)
+
+
+def mark_invalidated(manifest, issued):
+    """
+    Record an invalidation CloudFront accepted: drop the pending paths it
+    covered and start a new debounce window.
+    """
+    state = manifest.setdefault('invalidation', {})
+    covered = set(issued['covered'])
+    state['pending_paths'] = [path for path in state.get('pending_paths', []) if path not in covered]
+    state['last_issued_at'] = max(state.get('last_issued_at', 0), issued['issued_at'])
+
+
+def invalidate_site(manifest, changed_keys, issued, timer):
+    """
+    Plan and issue this run's CloudFront invalidation, before the manifest is
+    written. The debounce state only changes once CloudFront accepted the
+    request; if the call fails the paths stay pending for the next run.
+    
+    `issued` is this invocation's invalidation record ({} until one is made):
+    'paths' sent to CloudFront, the pending paths they 'covered', 'issued_at',
+    or the last 'error'. It is updated in place and survives retries of a
+    lost manifest write, which then do not invalidate the same paths twice.
+    """
+    if 'issued_at' in issued:
+        mark_invalidated(manifest, issued)
+    paths = plan_invalidation(manifest, changed_keys)
+    if not paths:
+        return issued
+    
+    covered = manifest['invalidation']['pending_paths']
+    try:
+        with timer.phase('invalidate'):
+            create_invalidation(os.environ['DISTRIBUTION_ID'], paths)
+    except Exception as e:
+        print(f"⚠️ CloudFront invalidation failed, paths kept pending: {str(e)}")
+        issued['error'] = str(e)
+        return issued
+    
+    print(f"✅ CloudFront cache cleared for {os.environ['DISTRIBUTION_ID']}: {paths}")
+    issued.pop('error', None)
+    issued.update(paths=sorted(set(issued.get('paths', [])) | set(paths)),
+                  covered=sorted(set(issued.get('covered', [])) | set(covered)),
+                  issued_at=time.time())
+    mark_invalidated(manifest, issued)
+    return issued
+
+
+def create_invalidation(dist_id, paths):
+    cf_client.create_invalidation(
+        DistributionId=dist_id,
+        InvalidationBatch={
+            'Paths': {
+                'Quantity': len(paths),
+                'Items': paths
+            },
+            'CallerReference': f"lambda-refresh-{str(time.time())}"
+        }
+    )
+
+
+def emit_metrics(**metrics):
+    """Print counts in CloudWatch Embedded Metric Format (picked up from the Lambda logs)."""
+    print(json.dumps({
+        '_aws': {
+            'Timestamp': int(time.time() * 1000),
+            'CloudWatchMetrics': [{
+                'Namespace': METRICS_NAMESPACE,
+                'Dimensions': [['FunctionName']],
+                'Metrics': [{'Name': name, 'Unit': 'Count'} for name in metrics]
+            }]
+        },
+        'FunctionName': os.environ.get('AWS_LAMBDA_FUNCTION_NAME', 'pptx-dashboard-function'),
+        **metrics
+    }))
+
+
+def load_manifest(bucket_name):
+    """
+    Return (manifest, etag) for the aggregate document index, or (None, None)
+    when it does not exist yet.
+    """
+    try:
+        response = s3_client.get_object(Bucket=bucket_name, Key=MANIFEST_KEY)
+    except ClientError as e:
+        if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+            return None, None
+        raise
+    return json.loads(response['Body'].read().decode('utf-8')), response['ETag']
+
+
+def save_manifest(bucket_name, manifest, etag=None):
+    """
+    Write the manifest. With an ETag the write only succeeds if nobody else
+    updated it since it was read (S3 conditional write); without one it only
+    succeeds if it still does not exist.
+    """
+    kwargs = {'IfMatch': etag} if etag else {'IfNoneMatch': '*'}
+    s3_client.put_object(
+        Bucket=bucket_name,
+        Key=MANIFEST_KEY,
+        Body=json.dumps(manifest, separators=(',', ':')),
+        ContentType='application/json',
+        CacheControl='no-cache',
+        **kwargs
+    )
+
+
+def needs_reconcile(manifest):
+    """Full rescans run when there is no manifest or the last one is too old."""
+    if manifest is None:
+        return True
+    try:
+        reconciled_at = datetime.fromisoformat(manifest['reconciled_at'].replace('Z', ''))
+    except (KeyError, ValueError):
+        return True
+    return (datetime.utcnow() - reconciled_at).total_seconds() > RECONCILE_INTERVAL_SECONDS
+
+
+class PhaseTimer:
+    """Accumulates wall-clock milliseconds per named phase."""
+    
+    def __init__(self):
+        self.timings = {}
+    
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.timings[name] = round(self.timings.get(name, 0) + elapsed, 1)
+
+
+def iter_metadata_keys(bucket_name, timer):
+    """Yield metadata keys page by page; time spent listing is recorded."""
+    pages = iter(s3_client.get_paginator('list_objects_v2').paginate(
+        Bucket=bucket_name, Prefix=METADATA_PREFIX))
+    while True:
+        with timer.phase('list'):
+            page = next(pages, None)
+        if page is None:
+            return
+        yield [obj['Key'] for obj in page.get('Contents', []) if obj['Key'].lower().endswith('.json')]
+
+
+def merge_documents(reconciled, current, started_at):
+    """
+    Merge the documents of a manifest written concurrently with a rescan.
+    
+    The rescan is authoritative for what it read; entries the other writer
+    added or updated after the rescan started (by create_date) are kept, so
+    incremental updates are not lost. Older entries missing from the rescan
+    belong to deleted metadata and stay dropped.
+    """
+    merged = dict(reconciled)
+    for key, doc in current.items():
+        if doc.get('create_date', '') >= started_at and \
+                doc.get('create_date', '') >= merged.get(key, {}).get('create_date', ''):
+            merged[key] = doc
+    return merged
+
+
+def reconcile_manifest(bucket_name, timer=None, previous=None, etag=None, written=(), issued=None):
+    """
+    Rebuild the manifest from every object under metadata/ and publish the
+    site from it. Returns (manifest, written keys, failed keys, invalidation
+    record). Page hashes and invalidation state carry over from the previous
+    manifest.
+    
+    Keys are listed with a paginator and the metadata bodies are fetched by a
+    bounded thread pool while the next page is being listed, so only about
+    two pages of requests are in flight at once.
+    
+    The manifest is written conditionally on `etag` (the previous manifest's,
+    None if there was none). If another invocation wrote it in the meantime,
+    its newer entries are merged in and the site is published again.
+    """
+    timer = timer or PhaseTimer()
+    print(f"📋 Reconciling manifest from metadata/ listing ({RECONCILE_WORKERS} workers)...")
+    started_at = utc_now_iso()
+    documents = {}
+    
+    def drain(pending):
+        with timer.phase('fetch'):
+            for key, future in pending:
+                metadata = future.result()
+                if metadata is not None:
+                    documents[key] = document_entry(metadata)
+    
+    with ThreadPoolExecutor(max_workers=RECONCILE_WORKERS) as executor:
+        pending = []
+        for keys in iter_metadata_keys(bucket_name, timer):
+            submitted = [(key, executor.submit(read_metadata, bucket_name, key)) for key in keys]
+            drain(pending)
+            pending = submitted
+        drain(pending)
+    
+    written = set(written)
+    issued = {} if issued is None else issued
+    for attempt in range(1, MANIFEST_MAX_RETRIES + 1):
+        previous = previous or {}
+        manifest = {'version': 1, 'reconciled_at': started_at, 'documents': documents,
+                    'next_doc_id': previous.get('next_doc_id', 0),
+                    'pages': previous.get('pages', {}), 'invalidation': previous.get('invalidation', {})}
+        assign_doc_ids(manifest, previous.get('documents'))
+        uploaded, failed = publish_site(bucket_name, manifest, timer, written)
+        written.update(uploaded)
+        invalidate_site(manifest, uploaded, issued, timer)
+        try:
+            with timer.phase('write_manifest'):
+                save_manifest(bucket_name, manifest, etag)
+            print(f"⏱️ Reconciled {len(documents)} documents: {timer.timings}")
+            return manifest, sorted(written), failed, issued
+        except ClientError as e:
+            if e.response['Error']['Code'] not in ('PreconditionFailed', 'ConditionalRequestConflict'):
+                raise
+            print(f"  🔁 Manifest changed during reconcile, merging ({attempt}/{MANIFEST_MAX_RETRIES})")
+        with timer.phase('read_manifest'):
+            previous, etag = load_manifest(bucket_name)
+        if previous:
+            documents = merge_documents(documents, previous['documents'], started_at)
+    
+    raise RuntimeError(f"Manifest kept changing during reconcile ({MANIFEST_MAX_RETRIES} attempts)")
+
+
+def update_manifest(bucket_name, metadata_keys, timer):
+    """
+    Apply the triggering metadata objects to the manifest: one GET per new
+    metadata file plus one GET and one PUT of the manifest, independent of
+    how many documents the library holds. Concurrent invocations are
+    serialised with conditional writes and retried.
+    
+    The site is uploaded and invalidated before the manifest is written, so
+    the manifest only records page hashes for objects that are actually in
+    the bucket and invalidations CloudFront accepted.
+    Returns (manifest, written keys, failed keys, invalidation record).
+    """
+    entries = {}
+    with timer.phase('fetch'):
+        for key in metadata_keys:
+            print(f"  📄 Reading: {key}")
+            metadata = read_metadata(bucket_name, key)
+            if metadata is not None:
+                entries[key] = document_entry(metadata)
+    
+    written = set()
+    issued = {}
+    for attempt in range(1, MANIFEST_MAX_RETRIES + 1):
+        with timer.phase('read_manifest'):
+            manifest, etag = load_manifest(bucket_name)
+        if needs_reconcile(manifest):
+            return reconcile_manifest(bucket_name, timer, manifest, etag, written, issued)
+        
+        previous_documents = dict(manifest['documents'])
+        manifest['documents'].update((key, dict(entry)) for key, entry in entries.items())
+        assign_doc_ids(manifest, previous_documents)
+        uploaded, failed = publish_site(bucket_name, manifest, timer, written)
+        written.update(uploaded)
+        invalidate_site(manifest, uploaded, issued, timer)
+        try:
+            with timer.phase('write_manifest'):
+                save_manifest(bucket_name, manifest, etag)
+            return manifest, sorted(written), failed, issued
+        except ClientError as e:
+            if e.response['Error']['Code'] not in ('PreconditionFailed', 'ConditionalRequestConflict'):
+                raise
+            print(f"  🔁 Manifest changed concurrently, retrying ({attempt}/{MANIFEST_MAX_RETRIES})")
+    
+    # Heavy contention: fall back to an authoritative rescan
+    with timer.phase('read_manifest'):
+        manifest, etag = load_manifest(bucket_name)
+    return reconcile_manifest(bucket_name, timer, manifest, etag, written, issued)
+
+
+def metadata_keys_in_event(event):
+    keys = []
+    for record in event.get('Records', []):
+        if 's3' not in record:
+            continue
+        key = unquote_plus(record['s3']['object']['key'])
+        if key.startswith(METADATA_PREFIX) and key.lower().endswith('.json'):
+            keys.append(key)
+    return keys
+
+
 def lambda_handler(event, context):
     """
-    Main Lambda handler - generates dashboard HTML from metadata files.
+    Main Lambda handler - generates dashboard HTML from the document manifest.
     
-    Triggered by S3 ObjectCreated events in the 'metadata/' prefix.
+    Triggered by S3 ObjectCreated events in the 'metadata/' prefix; only the
+    triggering records are read. A scheduled (EventBridge) invocation or an
+    event with {"reconcile": true} forces a full rescan of metadata/.
     """
     print("🚀 Dashboard Generator Lambda triggered")
     print(f"Event: {json.dumps(event, indent=2)}")
     
     try:
-        # Get bucket name from event
-        record = event['Records'][0]
-        bucket_name = record['s3']['bucket']['name']
+        records = event.get('Records', [])
+        # Get bucket name from event (scheduled runs use the BUCKET_NAME env var)
+        bucket_name = records[0]['s3']['bucket']['name'] if records else os.environ['BUCKET_NAME']
         
         print(f"📁 Processing metadata from bucket: {bucket_name}")
         
-        # List all JSON files in metadata/
-        print("📋 Listing metadata files...")
-        response = s3_client.list_objects_v2(
-            Bucket=bucket_name,
-            Prefix='metadata/'
-        )
-        
-        documents = []
-        total_slides = 0
-        
-        if 'Contents' in response:
-            for obj in response['Contents']:
-                key = obj['Key']
-                
-                # Skip if not a JSON file
-                if not key.lower().endswith('.json'):
-                    continue
-                
-                print(f"  📄 Reading: {key}")
-                
-                try:
-                    # Get and parse JSON
-                    json_response = s3_client.get_object(Bucket=bucket_name, Key=key)
-                    metadata = json.loads(json_response['Body'].read().decode('utf-8'))
-                    
-                    documents.append(metadata)
-                    total_slides += metadata.get('slide_count', 0)
-                    
-                except Exception as e:
-                    print(f"  ⚠️ Error reading {key}: {str(e)}")
-                    continue
+        timer = PhaseTimer()
+        # Only the pages and page data that changed are uploaded (gzip pre-compressed)
+        if event.get('reconcile') or event.get('source') == 'aws.events':
+            with timer.phase('read_manifest'):
+                previous, etag = load_manifest(bucket_name)
+            manifest, written, failed, issued = reconcile_manifest(bucket_name, timer, previous, etag)
+        else:
+            manifest, written, failed, issued = update_manifest(
+                bucket_name, metadata_keys_in_event(event), timer)
         
-        print(f"📊 Found {len(documents)} documents with {total_slides} total slides")
-        
-        # Sort documents by date (newest first)
-        documents.sort(key=lambda x: x.get('create_date', ''), reverse=True)
-        
-        # Generate table rows
-        table_rows = ""
-        for doc in documents:
-            table_rows += TABLE_ROW_TEMPLATE.format(
-                document_name=doc.get('pdf_name', 'Unknown'),
-                original_name=doc.get('original_name', ''),
-                slide_count=doc.get('slide_count', 0),
-                create_date=format_date(doc.get('create_date', '')),
-                pdf_path=doc.get('pdf_path', '#')
-            )
+        documents = manifest['documents'].values()
+        total_slides = sum(doc.get('slide_count', 0) for doc in documents)
         
-        # Determine empty state
-        empty_state = "" if documents else EMPTY_STATE_TEMPLATE
+        print(f"📊 Found {len(documents)} documents with {total_slides} total slides "
+              f"on {manifest['page_count']} page(s)")
         
-        # Generate final HTML
-        last_updated = datetime.utcnow().strftime('%b %d, %Y %H:%M')
+        dist_id = os.environ.get('DISTRIBUTION_ID')
+        invalidation_paths = issued.get('paths', [])
+        debounced = bool(dist_id and written and not invalidation_paths and 'error' not in issued)
+        if debounced:
+            print("⏳ CloudFront invalidation debounced; paths kept pending")
         
-        html_content = HTML_TEMPLATE.format(
-            total_documents=len(documents),
-            total_slides=total_slides,
-            last_updated=last_updated,
-            table_rows=table_rows,
-            empty_state=empty_state
+        emit_metrics(
+            ObjectsWritten=len(written),
+            ObjectsFailed=len(failed),
+            InvalidationsIssued=1 if invalidation_paths else 0,
+            InvalidationsDebounced=1 if debounced else 0,
+            InvalidationsFailed=1 if 'error' in issued else 0,
+            InvalidationPaths=len(invalidation_paths)
         )
+        print(f"⏱️ Phase timings (ms): {timer.timings}")
         
-        # Upload index.html to S3 root
-        print("📤 Uploading index.html to S3 root...")
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key='index.html',
-            Body=html_content,
-            ContentType='text/html',
-            CacheControl='max-age=60'
-        )
+        if failed:
+            # Their new hashes were not recorded, so the next run uploads them again
+            raise RuntimeError(f"Failed to upload {len(failed)} dashboard object(s): {failed}")
         
-        dist_id = os.environ.get('DISTRIBUTION_ID')
-
         print("✅ Dashboard generated successfully!")
-        if dist_id:
-            cf_client.create_invalidation(
-                DistributionId=dist_id,
-                InvalidationBatch={
-                    'Paths': {
-                        'Quantity': 1,
-                        'Items': ['/*'] # Tüm siteyi tazele
-                    },
-                    'CallerReference': f"lambda-refresh-{str(time.time())}"
-                }
-            )
-        print(f"✅ CloudFront cache cleared for {dist_id}")
 
 
         
@@ -308,7 +1053,11 @@ def lambda_handler(event, context):
             'body': json.dumps({
                 'message': 'Dashboard generated successfully',
                 'total_documents': len(documents),
-                'total_slides': total_slides
+                'total_slides': total_slides,
+                'pages': manifest['page_count'],
+                'objects_written': len(written),
+                'invalidated_paths': invalidation_paths,
+                'timings_ms': timer.timings
             })
         }
         
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+AWS ZERO to YETO - CloudWatch Yayınlama Yük Testi
+
+CloudWatchManager'ın metric ve log gönderme yollarını moto ile sahte bir AWS
+ortamına karşı, verilen hızda çalıştırır ve şunları ölçer:
+
+- Saniyedeki API çağrısı sayısı
+- API çağrısı başına gönderilen veri noktası
+- Kuyruğa ekleme -> flush gecikmesi (buffer'lı metrikler için)
+- Buffer bellek kullanımı (histogram kovaları ve tracemalloc tepe değeri)
+
+Kullanım:
+    pip install moto
+    python cloudwatch_benchmark.py --mode buffered --rate 20000 --duration 10
+    python cloudwatch_benchmark.py --mode all
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import time
+import tracemalloc
+from collections import Counter
+
+# Sahte AWS ortamı için credential'lar (gerçek hesaba istek gitmez)
+os.environ.setdefault('AWS_ACCESS_KEY_ID', 'testing')
+os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'testing')
+os.environ.setdefault('AWS_DEFAULT_REGION', 'eu-west-1')
+
+try:
+    from moto import mock_aws
+except ImportError:
+    mock_aws = None
+
+from cloudwatch_manager import CloudWatchManager
+
+NAMESPACE = 'AWS/ZeroToYeto/Benchmark'
+LOG_GROUP = '/aws/zero-to-yeto/benchmark'
+LOG_STREAM = 'bench-stream'
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(q * len(values)), len(values) - 1)]
+
+
+def count_api_calls(cw):
+    """Her iki client'ın API çağrılarını operasyon bazında say"""
+    calls = Counter()
+
+    def on_call(model, **kwargs):
+        calls[model.name] += 1
+
+    cw.cloudwatch.meta.events.register('before-call.*.*', on_call)
+    cw.logs.meta.events.register('before-call.*.*', on_call)
+    return calls
+
+
+def paced(rate, duration):
+    """Hedef hızda (işlem/sn) işlem indekslerini üret; 10 ms'lik dilimlerle çalışır"""
+    start = time.perf_counter()
+    sent = 0
+    while True:
+        elapsed = time.perf_counter() - start
+        if elapsed >= duration:
+            return
+        due = int(elapsed * rate) + 1
+        while sent < due:
+            yield sent
+            sent += 1
+        time.sleep(0.01)
+
+
+def run_custom(cw, rate, duration):
+    """Her değer için ayrı put_metric_data (send_custom_metric)"""
+    points = 0
+    for _ in paced(rate, duration):
+        cw.send_custom_metric(NAMESPACE, 'Latency', random.uniform(5, 500), unit='Milliseconds')
+        points += 1
+    return {'points': points, 'latencies': []}
+
+
+def run_buffered(cw, rate, duration, flush_interval):
+    """record_metric ile histogram buffer'ı; flush_interval'da gönderim"""
+    buffer = cw.metrics_buffer
+    buffer.flush_interval = flush_interval
+    pending = []
+    latencies = []
+    peak_buffer = 0
+
+    original_flush = buffer.flush
+
+    def timed_flush():
+        nonlocal pending
+        enqueued, pending = pending, []
+        result = original_flush()
+        done = time.perf_counter()
+        latencies.extend(done - t for t in enqueued)
+        return result
+
+    buffer.flush = timed_flush
+    points = 0
+    for i in paced(rate, duration):
+        pending.append(time.perf_counter())
+        cw.record_metric(NAMESPACE, 'Latency', random.lognormvariate(3, 1),
+                         dimensions={'Route': f'/api/{i % 10}'})
+        points += 1
+        if points % 100 == 0:
+            peak_buffer = max(peak_buffer, buffer.memory_bytes())
+    buffer.flush()
+    return {'points': points, 'latencies': latencies, 'peak_buffer_bytes': peak_buffer}
+
+
+def run_logs(cw, rate, duration):
+    """Her mesaj için send_log"""
+    points = 0
+    for i in paced(rate, duration):
+        cw.send_log(LOG_GROUP, LOG_STREAM, f'benchmark mesajı {i}')
+        points += 1
+    return {'points': points, 'latencies': []}
+
+
+def report(mode, result, calls, elapsed, tracemalloc_peak):
+    total_calls = sum(calls.values())
+    latencies = result['latencies']
+    print(f"\n📊 Sonuçlar: {mode}")
+    print(f"   Süre:                  {elapsed:.2f} sn")
+    print(f"   Gönderilen nokta:      {result['points']}")
+    print(f"   API çağrısı:           {total_calls} ({total_calls / elapsed:.1f}/sn)")
+    for name, count in calls.most_common():
+        print(f"     - {name}: {count}")
+    print(f"   Nokta / API çağrısı:   {result['points'] / max(total_calls, 1):.1f}")
+    if latencies:
+        print(f"   Enqueue->flush p50:    {percentile(latencies, 0.5) * 1000:.1f} ms")
+        print(f"   Enqueue->flush p99:    {percentile(latencies, 0.99) * 1000:.1f} ms")
+    if 'peak_buffer_bytes' in result:
+        print(f"   Buffer kovaları (tepe): {result['peak_buffer_bytes'] / 1024:.1f} KB")
+    print(f"   Tracemalloc tepe:      {tracemalloc_peak / 1024:.1f} KB")
+
+
+def run(mode, rate, duration, flush_interval):
+    cw = CloudWatchManager(region=os.environ['AWS_DEFAULT_REGION'])
+    cw.logs.create_log_group(logGroupName=LOG_GROUP)
+    cw.logs.create_log_stream(logGroupName=LOG_GROUP, logStreamName=LOG_STREAM)
+    calls = count_api_calls(cw)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    # Demo çıktıları ölçümü boğmasın
+    with contextlib.redirect_stdout(io.StringIO()):
+        if mode == 'custom':
+            result = run_custom(cw, rate, duration)
+        elif mode == 'buffered':
+            result = run_buffered(cw, rate, duration, flush_interval)
+        else:
+            result = run_logs(cw, rate, duration)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    report(mode, result, calls, elapsed, peak)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CloudWatch yayınlama yük testi (moto)')
+    parser.add_argument('--mode', choices=['custom', 'buffered', 'logs', 'all'], default='all')
+    parser.add_argument('--rate', type=float, default=200, help='Saniyedeki işlem sayısı')
+    parser.add_argument('--duration', type=float, default=5, help='Her senaryonun süresi (sn)')
+    parser.add_argument('--flush-interval', type=float, default=1, help='Buffer flush aralığı (sn)')
+    args = parser.parse_args()
+
+    if mock_aws is None:
+        print("❌ moto kurulu değil: pip install moto")
+        return
+
+    modes = ['custom', 'buffered', 'logs'] if args.mode == 'all' else [args.mode]
+    print("🏁 AWS ZERO to YETO - CloudWatch Yük Testi")
+    print("=" * 50)
+    print(f"Hız: {args.rate}/sn, süre: {args.duration} sn, flush: {args.flush_interval} sn")
+
+    for mode in modes:
+        with mock_aws():
+            run(mode, args.rate, args.duration, args.flush_interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,392 @@ AWS ZERO to YETO - CloudWatch Python Örneği
 import boto3
 import time
 import json
-from datetime import datetime, timedelta
+import bisect
+import calendar
+import math
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+# delete_alarms tek çağrıda en fazla 100 alarm kabul eder
+MAX_ALARMS_PER_DELETE = 100
+
+# Logs Insights limitleri: sorgu başına 50 log group, 10.000 sonuç satırı
+MAX_LOG_GROUPS_PER_QUERY = 50
+MAX_QUERY_RESULTS = 10000
+
+# put_metric_data limitleri: çağrı başına 1000 datum, datum başına 150 farklı değer.
+# İstek boyutu (1 MB) için çağrı başına toplam değer sayısı da sınırlanır.
+MAX_DATUMS_PER_PUT = 1000
+MAX_VALUES_PER_DATUM = 150
+MAX_VALUES_PER_PUT = 15000
+
+
+def _to_epoch(dt):
+    """datetime'ı UTC epoch saniyesine çevir (naive değerler UTC kabul edilir)"""
+    return calendar.timegm(dt.utctimetuple())
+
+
+class MetricCache:
+    """
+    get_metrics için bellek içi, sütun bazlı zaman serisi önbelleği.
+
+    Her (namespace, metric, period, statistic'ler) serisi için timestamp'ler ve
+    her istatistiğin değerleri ayrı `array('d')` sütunlarında tutulur. Seri daha
+    önce çekilmiş bir aralığı kapsıyorsa sadece eksik kuyruk CloudWatch'tan istenir.
+    """
+
+    def __init__(self, max_series=256, max_points=10000, max_age=timedelta(days=15)):
+        self.max_series = max_series
+        self.max_points = max_points
+        self.max_age = max_age
+        self._series = OrderedDict()
+
+    @staticmethod
+    def key(namespace, metric_name, period, statistics):
+        return (namespace, metric_name, period, tuple(statistics))
+
+    def get(self, key):
+        """Seriyi döndür ve LRU sırasında en sona taşı"""
+        series = self._series.get(key)
+        if series is not None:
+            self._series.move_to_end(key)
+        return series
+
+    def covers(self, key, start_time):
+        """Önbellek start_time'dan itibaren veriyi içeriyor mu?"""
+        series = self._series.get(key)
+        return series is not None and series['covered_from'] <= _to_epoch(start_time)
+
+    def store(self, key, datapoints, fetch_start, fetch_end):
+        """
+        [fetch_start, fetch_end] aralığında çekilen veriyi seriye yaz.
+        Aralıktaki eski noktalar (ör. yarım kalmış son periyot) yenileriyle değiştirilir.
+        """
+        start = _to_epoch(fetch_start)
+        end = _to_epoch(fetch_end)
+        statistics = key[3]
+        series = self._series.get(key)
+
+        if series is None or start > series['covered_to'] or start < series['covered_from']:
+            series = {
+                'timestamps': array('d'),
+                'values': {stat: array('d') for stat in statistics},
+                'unit': None,
+                'covered_from': start,
+                'covered_to': start
+            }
+            self._series[key] = series
+
+        # Yeni aralıkla çakışan kuyruğu kes
+        cut = bisect.bisect_left(series['timestamps'], start)
+        del series['timestamps'][cut:]
+        for column in series['values'].values():
+            del column[cut:]
+
+        for point in sorted(datapoints, key=lambda x: x['Timestamp']):
+            series['timestamps'].append(_to_epoch(point['Timestamp']))
+            for stat, column in series['values'].items():
+                column.append(point.get(stat, 0.0))
+            series['unit'] = point.get('Unit', series['unit'])
+
+        series['covered_to'] = max(series['covered_to'], end)
+        self._series.move_to_end(key)
+        self._evict(series)
+
+    def query(self, key, start_time, end_time):
+        """Önbellekteki noktaları get_metric_statistics formatında döndür"""
+        series = self.get(key)
+        if series is None:
+            return []
+
+        timestamps = series['timestamps']
+        lo = bisect.bisect_left(timestamps, _to_epoch(start_time))
+        hi = bisect.bisect_right(timestamps, _to_epoch(end_time))
+
+        datapoints = []
+        for i in range(lo, hi):
+            point = {'Timestamp': datetime.fromtimestamp(timestamps[i], tz=timezone.utc)}
+            for stat, column in series['values'].items():
+                point[stat] = column[i]
+            if series['unit']:
+                point['Unit'] = series['unit']
+            datapoints.append(point)
+        return datapoints
+
+    def _evict(self, series):
+        """Yaşa ve boyuta göre temizlik"""
+        oldest = time.time() - self.max_age.total_seconds()
+        cut = bisect.bisect_left(series['timestamps'], oldest)
+        cut = max(cut, len(series['timestamps']) - self.max_points)
+        if cut > 0:
+            del series['timestamps'][:cut]
+            for column in series['values'].values():
+                del column[:cut]
+            series['covered_from'] = max(series['covered_from'], series['timestamps'][0] if series['timestamps'] else oldest)
+
+        while len(self._series) > self.max_series:
+            self._series.popitem(last=False)
+
+    def clear(self):
+        self._series.clear()
+
+
+class LogHistogram:
+    """
+    DDSketch benzeri, dizi tabanlı logaritmik histogram.
+
+    Her değer `ceil(log_gamma(x))` indeksli kovaya sayılır; kova temsilcisi gerçek
+    değere en fazla `relative_accuracy` göreli hatayla yakındır. Kova sayısı
+    `max_buckets` ile sınırlıdır (aşılırsa en küçük kovalar birleştirilir), yani
+    gözlem sayısından bağımsız O(1) bellek kullanır. Histogramlar birleştirilebilir.
+    """
+
+    def __init__(self, relative_accuracy=0.01, max_buckets=2048):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self._counts = array('Q')
+        self._offset = 0
+        self.zero_count = 0
+        self.count = 0
+
+    def _index(self, value):
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _add_to_bucket(self, index, count):
+        if not self._counts:
+            self._offset = index
+            self._counts.append(0)
+        elif index < self._offset:
+            self._counts[0:0] = array('Q', bytes(8 * (self._offset - index)))
+            self._offset = index
+        elif index >= self._offset + len(self._counts):
+            self._counts.extend(array('Q', bytes(8 * (index - self._offset - len(self._counts) + 1))))
+        self._counts[index - self._offset] += count
+
+        overflow = len(self._counts) - self.max_buckets
+        if overflow > 0:
+            # En düşük kovaları birleştir (düşük yüzdelikler hassasiyet kaybeder)
+            self._counts[overflow] += sum(self._counts[:overflow])
+            del self._counts[:overflow]
+            self._offset += overflow
+
+    def add(self, value, count=1):
+        """Gözlem ekle (0 ve negatif değerler sıfır kovasına sayılır)"""
+        self.count += count
+        if value <= 0:
+            self.zero_count += count
+        else:
+            self._add_to_bucket(self._index(value), count)
+
+    def merge(self, other):
+        """Aynı accuracy ile oluşturulmuş başka bir histogramı ekle"""
+        if other.gamma != self.gamma:
+            raise ValueError("Farklı relative_accuracy ile histogramlar birleştirilemez")
+        self.zero_count += other.zero_count
+        self.count += other.count
+        for i, count in enumerate(other._counts):
+            if count:
+                self._add_to_bucket(other._offset + i, count)
+
+    def nbytes(self):
+        """Kova dizisinin bellek kullanımı (byte)"""
+        return len(self._counts) * self._counts.itemsize
+
+    def buckets(self):
+        """(temsilci değer, adet) çiftlerini artan sırada döndür"""
+        if self.zero_count:
+            yield 0.0, self.zero_count
+        for i, count in enumerate(self._counts):
+            if count:
+                yield 2 * self.gamma ** (self._offset + i) / (self.gamma + 1), count
+
+    def quantile(self, q):
+        """Yaklaşık yüzdelik değeri (0 <= q <= 1)"""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for value, count in self.buckets():
+            seen += count
+            if seen > rank:
+                return value
+        return value
+
+
+class MetricsBuffer:
+    """
+    Yüksek frekanslı metrikleri istemci tarafında LogHistogram'larda biriktirir
+    ve put_metric_data'ya `Values`/`Counts` dizileri olarak gönderir. CloudWatch
+    bu dağılımdan p50/p99 gibi yüzdelikleri hesaplayabilir.
+    """
+
+    def __init__(self, cloudwatch, flush_interval=60, relative_accuracy=0.01, max_buckets=2048):
+        self.cloudwatch = cloudwatch
+        self.flush_interval = flush_interval
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._series = {}
+        self._window_start = None
+        self._lock = threading.Lock()
+        self.stats = {'observations': 0, 'flushes': 0, 'api_calls': 0, 'datums': 0, 'values': 0, 'errors': 0}
+
+    def record(self, namespace, metric_name, value, unit='Milliseconds', dimensions=None):
+        """Tek gözlem ekle; flush_interval dolduysa buffer'ı gönder"""
+        key = (namespace, metric_name, unit, tuple(sorted((dimensions or {}).items())))
+        with self._lock:
+            histogram = self._series.get(key)
+            if histogram is None:
+                histogram = self._series[key] = LogHistogram(self.relative_accuracy, self.max_buckets)
+                if self._window_start is None:
+                    self._window_start = time.time()
+            histogram.add(value)
+            self.stats['observations'] += 1
+            due = time.time() - self._window_start >= self.flush_interval
+        if due:
+            self.flush()
+
+    def _build_datums(self, series, timestamp):
+        """Namespace bazında gruplanmış MetricData listeleri oluştur"""
+        by_namespace = {}
+        for (namespace, metric_name, unit, dimensions), histogram in series.items():
+            buckets = list(histogram.buckets())
+            for i in range(0, len(buckets), MAX_VALUES_PER_DATUM):
+                chunk = buckets[i:i + MAX_VALUES_PER_DATUM]
+                datum = {
+                    'MetricName': metric_name,
+                    'Timestamp': timestamp,
+                    'Unit': unit,
+                    'Values': [value for value, _ in chunk],
+                    'Counts': [float(count) for _, count in chunk]
+                }
+                if dimensions:
+                    datum['Dimensions'] = [{'Name': name, 'Value': str(val)} for name, val in dimensions]
+                by_namespace.setdefault(namespace, []).append(datum)
+        return by_namespace
+
+    def flush(self):
+        """Biriken histogramları gönder; gönderilen datum sayısını döndür"""
+        with self._lock:
+            series, self._series = self._series, {}
+            window_start, self._window_start = self._window_start, None
+        if not series:
+            return 0
+
+        timestamp = datetime.fromtimestamp(window_start, tz=timezone.utc)
+        sent = 0
+        for namespace, datums in self._build_datums(series, timestamp).items():
+            batch, batch_values = [], 0
+            for datum in datums + [None]:
+                if batch and (datum is None or len(batch) >= MAX_DATUMS_PER_PUT or
+                              batch_values + len(datum['Values']) > MAX_VALUES_PER_PUT):
+                    try:
+                        self.cloudwatch.put_metric_data(Namespace=namespace, MetricData=batch)
+                        sent += len(batch)
+                        self.stats['datums'] += len(batch)
+                        self.stats['values'] += batch_values
+                    except Exception as e:
+                        print(f"❌ Metric buffer gönderme hatası: {str(e)}")
+                        self.stats['errors'] += 1
+                    self.stats['api_calls'] += 1
+                    batch, batch_values = [], 0
+                if datum is not None:
+                    batch.append(datum)
+                    batch_values += len(datum['Values'])
+        self.stats['flushes'] += 1
+        return sent
+
+    def pending_series(self):
+        with self._lock:
+            return len(self._series)
+
+    def memory_bytes(self):
+        """Bekleyen histogramların kova dizilerinin toplam boyutu (byte)"""
+        with self._lock:
+            return sum(histogram.nbytes() for histogram in self._series.values())
+
+
+class RateLimiter:
+    """Thread-safe basit token bucket (saniyede `rate` çağrı)"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst or rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class _QueryTracker:
+    """
+    query_logs'un çalışmakta olan Logs Insights sorguları. Generator kapatıldığında
+    close() kalan sorgu id'lerini döndürür; sonrasında başlayan sorgu kaydedilmez.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active = set()
+        self.closed = False
+
+    def started(self, query_id):
+        """Sorguyu kaydet; tracker kapanmışsa False döner (sorgu durdurulmalı)"""
+        with self._lock:
+            if self.closed:
+                return False
+            self._active.add(query_id)
+            return True
+
+    def finished(self, query_id):
+        with self._lock:
+            self._active.discard(query_id)
+
+    def close(self):
+        with self._lock:
+            self.closed = True
+            active, self._active = self._active, set()
+            return active
+
+
+def _alarm_differs(desired, existing):
+    """Spec'te verilen alanlardan biri mevcut alarmdan farklı mı?"""
+    for field, value in desired.items():
+        current = existing.get(field)
+        if field == 'Dimensions':
+            value = sorted((d['Name'], d['Value']) for d in value or [])
+            current = sorted((d['Name'], d['Value']) for d in current or [])
+        elif isinstance(value, (list, tuple)):
+            # Sıra önemsiz; Metrics gibi dict listeleri kanonik JSON olarak karşılaştırılır
+            value = sorted(json.dumps(item, sort_keys=True, default=str) for item in value)
+            current = sorted(json.dumps(item, sort_keys=True, default=str) for item in current or [])
+        elif isinstance(value, (int, float)) and isinstance(current, (int, float)):
+            value, current = float(value), float(current)
+        if value != current:
+            return True
+    return False
+
 
 class CloudWatchManager:
-    def __init__(self, region='eu-west-1'):
+    def __init__(self, region='eu-west-1', metric_cache=None, flush_interval=60):
         self.cloudwatch = boto3.client('cloudwatch', region_name=region)
         self.logs = boto3.client('logs', region_name=region)
+        self.metric_cache = metric_cache if metric_cache is not None else MetricCache()
+        self.metrics_buffer = MetricsBuffer(self.cloudwatch, flush_interval=flush_interval)
     
     def send_custom_metric(self, namespace, metric_name, value, unit='Count'):
         """Custom metric gönder"""
@@ -35,29 +415,142 @@ class CloudWatchManager:
             print(f"❌ Metric gönderme hatası: {str(e)}")
             return False
     
-    def create_alarm(self, alarm_name, metric_name, namespace, threshold, comparison='GreaterThanThreshold'):
+    def record_metric(self, namespace, metric_name, value, unit='Milliseconds', dimensions=None):
+        """
+        Yüksek frekanslı metriği (ör. latency) buffer'a ekle. Değerler histogram
+        olarak birikir ve flush_interval'da tek çağrıda gönderilir.
+        """
+        self.metrics_buffer.record(namespace, metric_name, value, unit, dimensions)
+    
+    def flush_metrics(self):
+        """Buffer'daki histogramları hemen gönder"""
+        sent = self.metrics_buffer.flush()
+        if sent:
+            print(f"✅ {sent} histogram datum gönderildi")
+        return sent
+    
+    @staticmethod
+    def alarm_spec(alarm_name, metric_name, namespace, threshold, comparison='GreaterThanThreshold',
+                   period=300, evaluation_periods=2, statistic='Average', **extra):
+        """put_metric_alarm parametrelerini (sync_alarms spec formatında) hazırla"""
+        spec = {
+            'AlarmName': alarm_name,
+            'ComparisonOperator': comparison,
+            'EvaluationPeriods': evaluation_periods,
+            'MetricName': metric_name,
+            'Namespace': namespace,
+            'Period': period,
+            'Statistic': statistic,
+            'Threshold': threshold,
+            'ActionsEnabled': False,  # Demo için action yok
+            'AlarmDescription': f'AWS ZERO to YETO - {metric_name} alarm'
+        }
+        spec.update(extra)
+        return spec
+    
+    def create_alarm(self, alarm_name, metric_name, namespace, threshold, comparison='GreaterThanThreshold',
+                     period=300, evaluation_periods=2, statistic='Average'):
         """CloudWatch alarm oluştur"""
         try:
             print(f"🚨 Alarm oluşturuluyor: {alarm_name}")
             
-            self.cloudwatch.put_metric_alarm(
-                AlarmName=alarm_name,
-                ComparisonOperator=comparison,
-                EvaluationPeriods=2,
-                MetricName=metric_name,
-                Namespace=namespace,
-                Period=300,
-                Statistic='Average',
-                Threshold=threshold,
-                ActionsEnabled=False,  # Demo için action yok
-                AlarmDescription=f'AWS ZERO to YETO - {metric_name} alarm'
-            )
+            self.cloudwatch.put_metric_alarm(**self.alarm_spec(
+                alarm_name, metric_name, namespace, threshold, comparison,
+                period=period, evaluation_periods=evaluation_periods, statistic=statistic
+            ))
             print(f"✅ Alarm oluşturuldu: {alarm_name}")
             return True
         except Exception as e:
             print(f"❌ Alarm oluşturma hatası: {str(e)}")
             return False
     
+    def list_alarms(self, alarm_name_prefix=None):
+        """Tüm metric alarm'larını sayfalayarak listele"""
+        paginator = self.cloudwatch.get_paginator('describe_alarms')
+        params = {'AlarmTypes': ['MetricAlarm']}
+        if alarm_name_prefix:
+            params['AlarmNamePrefix'] = alarm_name_prefix
+        
+        alarms = {}
+        for page in paginator.paginate(**params):
+            for alarm in page.get('MetricAlarms', []):
+                alarms[alarm['AlarmName']] = alarm
+        return alarms
+    
+    def sync_alarms(self, desired_specs, alarm_name_prefix=None, delete_missing=True,
+                    max_workers=8, calls_per_second=10, dry_run=False):
+        """
+        Mevcut alarm'ları istenen spec listesiyle eşitle.
+        
+        Sadece değişen/yeni alarm'lar için put_metric_alarm çağrılır; spec'te olmayan
+        alarm'lar (sadece alarm_name_prefix kapsamında) 100'lük gruplar halinde silinir.
+        alarm_name_prefix verilmezse hiçbir alarm silinmez; aksi halde eksik bir spec
+        listesi bölgedeki ilgisiz alarm'ları da silerdi.
+        """
+        summary = {'created': [], 'updated': [], 'deleted': [], 'unchanged': 0, 'errors': []}
+        try:
+            desired = {spec['AlarmName']: spec for spec in desired_specs}
+            existing = self.list_alarms(alarm_name_prefix)
+            print(f"🔄 Alarm senkronizasyonu: {len(desired)} istenen, {len(existing)} mevcut")
+            
+            to_put = []
+            for name, spec in desired.items():
+                if name not in existing:
+                    summary['created'].append(name)
+                    to_put.append(spec)
+                elif _alarm_differs(spec, existing[name]):
+                    summary['updated'].append(name)
+                    to_put.append(spec)
+                else:
+                    summary['unchanged'] += 1
+            
+            to_delete = []
+            if delete_missing and not alarm_name_prefix:
+                print("⚠️ alarm_name_prefix verilmedi, silme adımı atlanıyor")
+            elif delete_missing:
+                to_delete = sorted(name for name in existing if name not in desired)
+            
+            if dry_run:
+                summary['deleted'] = to_delete
+                print(f"🧪 Dry run: {len(to_put)} put, {len(to_delete)} silme yapılacaktı")
+                return summary
+            
+            limiter = RateLimiter(calls_per_second)
+            
+            def put(spec):
+                limiter.acquire()
+                try:
+                    self.cloudwatch.put_metric_alarm(**spec)
+                except Exception as e:
+                    summary['errors'].append({'AlarmName': spec['AlarmName'], 'error': str(e)})
+                    for key in ('created', 'updated'):
+                        if spec['AlarmName'] in summary[key]:
+                            summary[key].remove(spec['AlarmName'])
+            
+            def delete(names):
+                limiter.acquire()
+                try:
+                    self.cloudwatch.delete_alarms(AlarmNames=names)
+                    # Sadece onaylanan silmeler sayılır
+                    summary['deleted'].extend(names)
+                except Exception as e:
+                    summary['errors'].extend({'AlarmName': name, 'error': str(e)} for name in names)
+            
+            batches = [to_delete[i:i + MAX_ALARMS_PER_DELETE]
+                       for i in range(0, len(to_delete), MAX_ALARMS_PER_DELETE)]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(put, to_put))
+                list(executor.map(delete, batches))
+            summary['deleted'].sort()
+            
+            print(f"✅ Alarm senkronizasyonu tamamlandı: {len(summary['created'])} yeni, "
+                  f"{len(summary['updated'])} güncellendi, {len(summary['deleted'])} silindi, "
+                  f"{summary['unchanged']} değişmedi, {len(summary['errors'])} hata")
+        except Exception as e:
+            print(f"❌ Alarm senkronizasyon hatası: {str(e)}")
+            summary['errors'].append({'error': str(e)})
+        return summary
+    
     def send_log(self, log_group, log_stream, message):
         """CloudWatch Logs'a mesaj gönder"""
         try:
@@ -102,24 +595,146 @@ class CloudWatchManager:
             print(f"❌ Log gönderme hatası: {str(e)}")
             return False
     
-    def get_metrics(self, namespace, metric_name, hours=1):
-        """Metric verilerini al"""
+    def _stop_queries(self, query_ids):
+        for query_id in query_ids:
+            try:
+                self.logs.stop_query(queryId=query_id)
+            except Exception:
+                # Bu arada tamamlanmış sorgu durdurulamaz; yok sayılır
+                pass
+    
+    def _run_insights_query(self, groups, query, start, end, limit, limiter, min_window, tracker):
+        """
+        Tek bir Logs Insights sorgusunu çalıştırıp tamamlanana kadar bekle.
+        Sonuç limiti dolarsa aralık ikiye bölünüp tekrar sorgulanır.
+        Tracker kapanırsa (generator kapatıldı) beklemeyi bırakır.
+        """
+        limiter.acquire()
+        if tracker.closed:
+            return []
+        query_id = self.logs.start_query(
+            logGroupNames=groups,
+            startTime=start,
+            endTime=end,
+            queryString=query,
+            limit=limit
+        )['queryId']
+        if not tracker.started(query_id):
+            self._stop_queries([query_id])
+            return []
+        
+        # Adaptif backoff: sonuç gelmeye devam ettikçe sık, gelmiyorsa seyrek kontrol et
+        delay = 0.2
+        seen = 0
+        while True:
+            time.sleep(delay)
+            if tracker.closed:
+                # Durdurma işini query_logs üstlenir
+                return []
+            response = self.logs.get_query_results(queryId=query_id)
+            status = response['status']
+            if status == 'Complete':
+                break
+            if status in ('Failed', 'Cancelled', 'Timeout', 'Unknown'):
+                tracker.finished(query_id)
+                raise RuntimeError(f"Logs Insights sorgusu başarısız ({status}): {query_id}")
+            if len(response.get('results', [])) <= seen:
+                delay = min(delay * 1.5, 5.0)
+            seen = len(response.get('results', []))
+        tracker.finished(query_id)
+        
+        rows = [{field['field']: field['value'] for field in row} for row in response['results']]
+        
+        if len(rows) >= limit and end - start > min_window:
+            mid = (start + end) // 2
+            return (self._run_insights_query(groups, query, start, mid, limit, limiter, min_window, tracker) +
+                    self._run_insights_query(groups, query, mid + 1, end, limit, limiter, min_window, tracker))
+        return rows
+    
+    def query_logs(self, groups, query, start, end, window=timedelta(hours=1),
+                   max_workers=10, queries_per_second=5, limit=MAX_QUERY_RESULTS,
+                   min_window=timedelta(minutes=1)):
+        """
+        Logs Insights sorgusunu paralel alt zaman aralıklarında çalıştır.
+        
+        Zaman aralığı `window` büyüklüğünde parçalara, log group'lar 50'lik gruplara
+        bölünür. Satırlar kronolojik pencere sırasıyla, hazır oldukça yield edilir.
+        stats gibi aggregation sorgularında sonuçlar pencere başına ayrı döner.
+        Generator erken kapatılırsa (close() veya referansı bırakılırsa) hâlâ
+        çalışan sorgular stop_query ile durdurulur.
+        """
+        if isinstance(groups, str):
+            groups = [groups]
+        start = _to_epoch(start) if isinstance(start, datetime) else int(start)
+        end = _to_epoch(end) if isinstance(end, datetime) else int(end)
+        step = max(int(window.total_seconds()), 1)
+        
+        windows = []
+        window_start = start
+        while window_start <= end:
+            window_end = min(window_start + step - 1, end)
+            windows.append((window_start, window_end))
+            window_start = window_end + 1
+        group_chunks = [groups[i:i + MAX_LOG_GROUPS_PER_QUERY]
+                        for i in range(0, len(groups), MAX_LOG_GROUPS_PER_QUERY)]
+        
+        print(f"🔎 Logs Insights: {len(groups)} log group, {len(windows)} zaman penceresi")
+        
+        limiter = RateLimiter(queries_per_second)
+        tracker = _QueryTracker()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [
+                [executor.submit(self._run_insights_query, chunk, query, window_start, window_end,
+                                 limit, limiter, int(min_window.total_seconds()), tracker)
+                 for chunk in group_chunks]
+                for window_start, window_end in windows
+            ]
+            for window_futures in futures:
+                rows = []
+                for future in window_futures:
+                    rows.extend(future.result())
+                if len(window_futures) > 1 and all('@timestamp' in row for row in rows):
+                    rows.sort(key=lambda row: row['@timestamp'])
+                yield from rows
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._stop_queries(tracker.close())
+    
+    def get_metrics(self, namespace, metric_name, hours=1, period=300,
+                    statistics=('Sum', 'Average', 'Maximum'), use_cache=True):
+        """Metric verilerini al (önbellekte olan aralık tekrar istenmez)"""
         try:
             print(f"📈 Metrik verileri alınıyor: {namespace}/{metric_name}")
             
             end_time = datetime.utcnow()
             start_time = end_time - timedelta(hours=hours)
+            cache_key = MetricCache.key(namespace, metric_name, period, statistics)
+            
+            fetch_start = start_time
+            if use_cache and self.metric_cache.covers(cache_key, start_time):
+                # Sadece eksik kuyruğu iste; son periyot yarım olabileceği için onu da yenile
+                covered_to = self.metric_cache.get(cache_key)['covered_to']
+                fetch_start = max(
+                    start_time,
+                    datetime.utcfromtimestamp(covered_to) - timedelta(seconds=period)
+                )
+                print(f"⚡ Önbellekten okunuyor, eksik aralık: {fetch_start.strftime('%H:%M')} sonrası")
             
             response = self.cloudwatch.get_metric_statistics(
                 Namespace=namespace,
                 MetricName=metric_name,
-                StartTime=start_time,
+                StartTime=fetch_start,
                 EndTime=end_time,
-                Period=300,  # 5 dakika
-                Statistics=['Sum', 'Average', 'Maximum']
+                Period=period,  # Varsayılan 5 dakika
+                Statistics=list(statistics)
             )
             
-            datapoints = response['Datapoints']
+            if use_cache:
+                self.metric_cache.store(cache_key, response['Datapoints'], fetch_start, end_time)
+                datapoints = self.metric_cache.query(cache_key, start_time, end_time)
+            else:
+                datapoints = response['Datapoints']
             if datapoints:
                 print(f"📊 {len(datapoints)} veri noktası bulundu:")
                 for point in sorted(datapoints, key=lambda x: x['Timestamp']):
@@ -146,6 +761,11 @@ def main():
         cw.send_custom_metric('AWS/ZeroToYeto', 'UserActions', 5)
         cw.send_custom_metric('AWS/ZeroToYeto', 'PageViews', 10)
         
+        # Yüksek frekanslı latency: her değer için ayrı çağrı yerine histogram
+        for i in range(1000):
+            cw.record_metric('AWS/ZeroToYeto', 'RequestLatency', 20 + (i % 100) * 1.5)
+        cw.flush_metrics()
+        
         # 2. Log gönder
         print("\n📝 CloudWatch Logs")
         cw.send_log('/aws/zero-to-yeto/demo', 'app-stream', 'Uygulama başlatıldı')
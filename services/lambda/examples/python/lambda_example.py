@@ -5,71 +5,247 @@ AWS ZERO to YETO - Lambda Python Örneği
 Bu dosya Lambda fonksiyonlarının temel kullanımını gösterir
 """
 
+import time
+_MODULE_START = time.perf_counter()
+
+import os
 import json
-import boto3
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import datetime
 
-# Logging konfigürasyonu
+# Logging konfigürasyonu (LOG_LEVEL=DEBUG ile tüm event loglanır; geçersiz değerde INFO)
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+_log_level = logging.getLevelName(os.environ.get('LOG_LEVEL', 'INFO').upper())
+logger.setLevel(_log_level if isinstance(_log_level, int) else logging.INFO)
+
+# Opsiyonel hızlı JSON backend'i: orjson varsa onu, yoksa girintisiz stdlib encoder'ı kullan.
+# lambda_function.py'deki helper ile aynıdır; OPT_NON_STR_KEYS, stdlib gibi
+# int/float/bool/None anahtarları string'e çevirir.
+try:
+    import orjson
+    
+    def dumps(obj):
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    JSON_BACKEND = 'orjson'
+except ImportError:
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=str).encode
+    JSON_BACKEND = 'json'
+
+# API Gateway yanıtları için varsayılan header'lar
+DEFAULT_HEADERS = {
+    'Content-Type': 'application/json',
+    'Access-Control-Allow-Origin': '*'
+}
+
+# Bileşen bazında init süreleri (ms). boto3 ve client'lar import anında değil,
+# ilk ihtiyaç duyulduğunda oluşturulur; böylece AWS'ye ihtiyaç duymayan
+# route'lar (API Gateway, zamanlanmış event'ler) cold start'ta bu maliyeti ödemez.
+INIT_TIMINGS = {}
+_reported_timings = set()
+
+# Batch record'larını paralel işlerken kullanılacak en fazla thread sayısı
+MAX_WORKERS = int(os.environ.get('MAX_WORKERS', '8'))
+# Lambda timeout'undan önce sonuçları döndürebilmek için bırakılan pay (ms)
+TIME_SAFETY_MARGIN_MS = int(os.environ.get('TIME_SAFETY_MARGIN_MS', '2000'))
+
+# Lazy AWS client cache'i (container yaşadığı sürece yeniden kullanılır)
+_clients = {}
+_clients_lock = threading.Lock()
+
+def get_client(service_name):
+    """
+    AWS client'ını ilk kullanımda oluşturur ve cache'ler
+    """
+    client = _clients.get(service_name)
+    if client is not None:
+        return client
+    
+    with _clients_lock:
+        if service_name not in _clients:
+            start = time.perf_counter()
+            import boto3  # Ağır import: sadece ilk client oluşturulurken
+            INIT_TIMINGS.setdefault('import:boto3', (time.perf_counter() - start) * 1000)
+            
+            start = time.perf_counter()
+            _clients[service_name] = boto3.client(service_name)
+            INIT_TIMINGS[f'client:{service_name}'] = (time.perf_counter() - start) * 1000
+        return _clients[service_name]
+
+def build_response(body, status_code=200, headers=None, **extra):
+    """
+    Lambda yanıtını oluşturur; body hızlı JSON backend'iyle, girintisiz serialize edilir
+    """
+    response = {
+        'statusCode': status_code,
+        'body': dumps(body)
+    }
+    if headers is not None:
+        response['headers'] = headers
+    response.update(extra)
+    return response
+
+def report_init_timings():
+    """
+    Yeni ölçülen init sürelerini loglar (cold start ve ilk client kullanımı)
+    """
+    new_components = [name for name in INIT_TIMINGS if name not in _reported_timings]
+    if not new_components:
+        return
+    for name in new_components:
+        logger.info(f"Init süresi - {name}: {INIT_TIMINGS[name]:.1f} ms")
+        _reported_timings.add(name)
+
+def process_records_concurrently(records, process_record, context, max_workers=MAX_WORKERS):
+    """
+    Record'ları sınırlı bir thread pool'da paralel işler.
+    
+    Sonuçlar record sırasıyla (sonuç, hata) çiftleri olarak döner. Kalan Lambda
+    süresi (güvenlik payı düşülerek) içinde bitmeyen record'lar TimeoutError ile
+    başarısız sayılır.
+    """
+    if not records:
+        return []
+    
+    budget_ms = max(context.get_remaining_time_in_millis() - TIME_SAFETY_MARGIN_MS, 0)
+    deadline = time.monotonic() + budget_ms / 1000
+    
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(records))))
+    try:
+        futures = [executor.submit(process_record, record) for record in records]
+        results = []
+        for future in futures:
+            try:
+                results.append((future.result(timeout=max(deadline - time.monotonic(), 0)), None))
+            except FuturesTimeoutError:
+                future.cancel()
+                results.append((None, TimeoutError('Lambda süre bütçesi doldu')))
+            except Exception as e:
+                results.append((None, e))
+        return results
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+class EventRouter:
+    """
+    Event imzasına göre handler seçen tablo tabanlı router.
+    
+    Handler'lar kayıt sırasında imzalarıyla (record eventSource, EventBridge
+    source'u veya üst seviye anahtar) eşlenir; bu tablo bir kez kurulur ve
+    her event'te tek bir sözlük aramasıyla handler bulunur. Route başına
+    çağrı sayısı ve süre istatistikleri tutulur.
+    """
+    
+    # EventBridge'de kayıtlı olmayan tüm source'lar için joker imza
+    ANY_SOURCE = '*'
+    
+    def __init__(self, default_route='generic'):
+        self.default_route = default_route
+        self._handlers = {}
+        self._signatures = {}
+        self._marker_keys = ()
+        self.stats = {}
+    
+    def route(self, event_type, records=(), sources=(), keys=()):
+        """
+        Handler'ı bir event tipi ve imzaları için kaydeden decorator
+        
+        records: Records[0]['eventSource'] değerleri ('aws:s3' gibi)
+        sources: EventBridge 'source' değerleri ('aws.events' gibi)
+        keys: event'i tanımlayan üst seviye anahtarlar ('httpMethod' gibi)
+        """
+        def register(handler):
+            self._handlers[event_type] = handler
+            for source in records:
+                self._signatures[('record', source)] = event_type
+            for source in sources:
+                self._signatures[('source', source)] = event_type
+            for key in keys:
+                self._signatures[('key', key)] = event_type
+                self._marker_keys += (key,)
+            return handler
+        return register
+    
+    def classify(self, event):
+        """Event'in imzasını çıkarır ve kayıtlı event tipini döndürür"""
+        records = event.get('Records')
+        if records:
+            first = records[0]
+            source = first.get('eventSource') or first.get('EventSource')
+            return self._signatures.get(('record', source), self.default_route)
+        
+        if 'detail-type' in event:
+            event_type = self._signatures.get(('source', event.get('source')))
+            if event_type is None:
+                event_type = self._signatures.get(('source', self.ANY_SOURCE), self.default_route)
+            return event_type
+        
+        for key in self._marker_keys:
+            if key in event:
+                return self._signatures[('key', key)]
+        return self.default_route
+    
+    def dispatch(self, event, context):
+        event_type = self.classify(event)
+        handler = self._handlers.get(event_type) or self._handlers[self.default_route]
+        
+        start = time.perf_counter()
+        try:
+            return handler(event, context)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            stats = self.stats.get(event_type)
+            if stats is None:
+                stats = self.stats[event_type] = {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0}
+            stats['count'] += 1
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+            logger.info(f"Route {event_type} -> {handler.__name__}: {elapsed_ms:.1f} ms")
 
-# Global AWS client'ları (cold start optimizasyonu için)
-s3_client = boto3.client('s3')
-dynamodb_client = boto3.client('dynamodb')
+router = EventRouter()
 
 def lambda_handler(event, context):
     """
     Ana Lambda handler fonksiyonu
     """
     try:
-        logger.info(f"Event alındı: {json.dumps(event)}")
-        
-        # Event tipini belirle
-        event_type = determine_event_type(event)
+        # Event'i sadece debug modunda serialize et
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Event alındı: {dumps(event)}")
         
-        # Event tipine göre işlem yap
-        if event_type == "api_gateway":
-            return handle_api_gateway(event, context)
-        elif event_type == "s3":
-            return handle_s3_event(event, context)
-        elif event_type == "scheduled":
-            return handle_scheduled_event(event, context)
-        else:
-            return handle_generic_event(event, context)
+        # Event tipine göre kayıtlı handler'a yönlendir
+        return router.dispatch(event, context)
             
     except Exception as e:
         logger.error(f"Beklenmeyen hata: {str(e)}")
-        return {
-            'statusCode': 500,
-            'body': json.dumps({
-                'error': 'İç sunucu hatası',
-                'message': str(e)
-            })
-        }
+        return build_response({
+            'error': 'İç sunucu hatası',
+            'message': str(e)
+        }, status_code=500)
+    finally:
+        # Cold start ve bu invocation'da oluşturulan client'ların süreleri
+        report_init_timings()
 
 def determine_event_type(event):
     """
     Event tipini belirler
     """
-    if 'httpMethod' in event:
-        return "api_gateway"
-    elif 'Records' in event and len(event['Records']) > 0:
-        if 's3' in event['Records'][0]:
-            return "s3"
-        elif 'dynamodb' in event['Records'][0]:
-            return "dynamodb"
-    elif 'source' in event and event['source'] == 'aws.events':
-        return "scheduled"
-    else:
-        return "generic"
+    return router.classify(event)
 
+@router.route('api_gateway', keys=('httpMethod',))
+@router.route('api_gateway_v2', keys=('routeKey',))
 def handle_api_gateway(event, context):
     """
-    API Gateway event'lerini işler
+    API Gateway (REST v1 ve HTTP API v2) event'lerini işler
     """
-    http_method = event.get('httpMethod', 'GET')
-    path = event.get('path', '/')
+    if 'httpMethod' in event:
+        http_method = event.get('httpMethod', 'GET')
+        path = event.get('path', '/')
+    else:
+        http_method = event.get('requestContext', {}).get('http', {}).get('method', 'GET')
+        path = event.get('rawPath', '/')
     body = event.get('body', '{}')
     
     logger.info(f"API Gateway isteği: {http_method} {path}")
@@ -84,56 +260,229 @@ def handle_api_gateway(event, context):
         'remaining_time': context.get_remaining_time_in_millis()
     }
     
+    return build_response(response_data, headers=DEFAULT_HEADERS)
+
+def process_s3_record(record):
+    """
+    Tek bir S3 record'unun dosya bilgilerini alır
+    """
+    bucket_name = record['s3']['bucket']['name']
+    object_key = record['s3']['object']['key']
+    event_name = record['eventName']
+    
+    logger.info(f"S3 Event: {event_name} - {bucket_name}/{object_key}")
+    
+    # Dosya bilgilerini al
+    response = get_client('s3').head_object(Bucket=bucket_name, Key=object_key)
+    
     return {
-        'statusCode': 200,
-        'headers': {
-            'Content-Type': 'application/json',
-            'Access-Control-Allow-Origin': '*'
-        },
-        'body': json.dumps(response_data, ensure_ascii=False)
+        'bucket': bucket_name,
+        'key': object_key,
+        'size': response['ContentLength'],
+        'type': response.get('ContentType', 'unknown'),
+        'event': event_name
     }
 
+@router.route('s3', records=('aws:s3',))
 def handle_s3_event(event, context):
     """
-    S3 event'lerini işler
+    S3 event'lerini işler (record'lar paralel, sonuçlar record sırasıyla)
     """
     logger.info("S3 event işleniyor...")
     
+    records = event['Records']
+    results = process_records_concurrently(records, process_s3_record, context)
+    
     processed_files = []
+    batch_item_failures = []
+    for record, (file_info, error) in zip(records, results):
+        if error is None:
+            processed_files.append(file_info)
+        else:
+            logger.error(f"Dosya bilgisi alınamadı: {str(error)}")
+            batch_item_failures.append({'itemIdentifier': record['s3']['object']['key']})
     
-    for record in event['Records']:
-        bucket_name = record['s3']['bucket']['name']
-        object_key = record['s3']['object']['key']
-        event_name = record['eventName']
-        
-        logger.info(f"S3 Event: {event_name} - {bucket_name}/{object_key}")
-        
-        # Dosya bilgilerini al
-        try:
-            response = s3_client.head_object(Bucket=bucket_name, Key=object_key)
-            file_size = response['ContentLength']
-            content_type = response.get('ContentType', 'unknown')
-            
-            processed_files.append({
-                'bucket': bucket_name,
-                'key': object_key,
-                'size': file_size,
-                'type': content_type,
-                'event': event_name
-            })
-            
-        except Exception as e:
-            logger.error(f"Dosya bilgisi alınamadı: {str(e)}")
+    return build_response({
+        'message': 'S3 event başarıyla işlendi',
+        'processed_files': processed_files,
+        'count': len(processed_files),
+        'failed_count': len(batch_item_failures)
+    }, batchItemFailures=batch_item_failures)
+
+def process_batch_by_partition(records, process_record, partition_key, context):
+    """
+    Record'ları partition key'e göre gruplar; gruplar paralel, her grup içindeki
+    record'lar sırayla işlenir. Bir record başarısız olursa aynı partition'daki
+    sonraki record'lar da (sıra bozulmasın diye) başarısız sayılır.
     
-    return {
-        'statusCode': 200,
-        'body': json.dumps({
-            'message': 'S3 event başarıyla işlendi',
-            'processed_files': processed_files,
-            'count': len(processed_files)
-        }, ensure_ascii=False)
+    Sonuçlar orijinal record sırasıyla (sonuç, hata) çiftleri olarak döner.
+    """
+    groups = {}
+    for index, record in enumerate(records):
+        groups.setdefault(partition_key(record), []).append(index)
+    group_list = list(groups.values())
+    
+    def run_group(indices):
+        results = []
+        for position, index in enumerate(indices):
+            try:
+                results.append((process_record(records[index]), None))
+            except Exception as e:
+                results.append((None, e))
+                skipped = RuntimeError('Aynı partition\'da önceki record başarısız oldu')
+                results.extend((None, skipped) for _ in indices[position + 1:])
+                break
+        return results
+    
+    results = [None] * len(records)
+    for indices, (group_results, error) in zip(group_list,
+                                               process_records_concurrently(group_list, run_group, context)):
+        for position, index in enumerate(indices):
+            results[index] = (None, error) if error is not None else group_results[position]
+    return results
+
+def batch_response(message, records, results, item_identifier):
+    """
+    Batch sonuçlarını partial batch response (batchItemFailures) formatına çevirir
+    """
+    batch_item_failures = []
+    processed = []
+    for record, (result, error) in zip(records, results):
+        if error is None:
+            processed.append(result)
+        else:
+            logger.error(f"Record işlenemedi ({item_identifier(record)}): {str(error)}")
+            batch_item_failures.append({'itemIdentifier': item_identifier(record)})
+    
+    return build_response({
+        'message': message,
+        'processed': processed,
+        'count': len(processed),
+        'failed_count': len(batch_item_failures)
+    }, batchItemFailures=batch_item_failures)
+
+# DynamoDB JSON -> Python deserializer (ilk kullanımda oluşturulur)
+_deserializer = None
+
+def deserialize_image(image):
+    """
+    DynamoDB Streams NewImage/OldImage'ı Python dict'ine çevirir
+    """
+    global _deserializer
+    if not image:
+        return None
+    if _deserializer is None:
+        from boto3.dynamodb.types import TypeDeserializer
+        _deserializer = TypeDeserializer()
+    deserialize = _deserializer.deserialize
+    return {name: deserialize(value) for name, value in image.items()}
+
+def process_dynamodb_record(record):
+    """
+    Tek bir DynamoDB Streams record'unu işler
+    """
+    change = record['dynamodb']
+    result = {
+        'event': record.get('eventName', 'UNKNOWN'),
+        'keys': deserialize_image(change.get('Keys')),
+        'new_image': deserialize_image(change.get('NewImage')),
+        'old_image': deserialize_image(change.get('OldImage'))
     }
+    logger.info(f"DynamoDB değişikliği: {result['event']} {result['keys']}")
+    return result
 
+@router.route('dynamodb', records=('aws:dynamodb',))
+def handle_dynamodb_event(event, context):
+    """
+    DynamoDB Streams event'lerini işler (aynı item'a ait değişiklikler sırayla)
+    """
+    logger.info("DynamoDB Streams event işleniyor...")
+    
+    records = event['Records']
+    results = process_batch_by_partition(
+        records,
+        process_dynamodb_record,
+        lambda record: json.dumps(record['dynamodb'].get('Keys'), sort_keys=True),
+        context
+    )
+    return batch_response('DynamoDB Streams event başarıyla işlendi', records, results,
+                          lambda record: record['dynamodb']['SequenceNumber'])
+
+def process_sqs_record(record):
+    """
+    Tek bir SQS mesajını işler
+    """
+    body = record.get('body', '')
+    try:
+        body = json.loads(body)
+    except ValueError:
+        pass
+    logger.info(f"SQS mesajı: {record['messageId']}")
+    return {'message_id': record['messageId'], 'body': body}
+
+@router.route('sqs', records=('aws:sqs',))
+def handle_sqs_event(event, context):
+    """
+    SQS event'lerini işler (FIFO kuyruklarda aynı MessageGroupId sırayla)
+    """
+    logger.info("SQS event işleniyor...")
+    
+    records = event['Records']
+    results = process_batch_by_partition(
+        records,
+        process_sqs_record,
+        lambda record: record.get('attributes', {}).get('MessageGroupId') or record['messageId'],
+        context
+    )
+    return batch_response('SQS event başarıyla işlendi', records, results,
+                          lambda record: record['messageId'])
+
+@router.route('sns', records=('aws:sns',))
+def handle_sns_event(event, context):
+    """
+    SNS bildirimlerini işler
+    """
+    logger.info("SNS event işleniyor...")
+
+    messages = []
+    for record in event['Records']:
+        sns = record['Sns']
+        message = sns.get('Message', '')
+        try:
+            message = json.loads(message)
+        except ValueError:
+            pass
+        logger.info(f"SNS mesajı: {sns.get('MessageId')}")
+        messages.append({
+            'message_id': sns.get('MessageId'),
+            'topic_arn': sns.get('TopicArn'),
+            'subject': sns.get('Subject'),
+            'message': message
+        })
+
+    return build_response({
+        'message': 'SNS event başarıyla işlendi',
+        'processed': messages,
+        'count': len(messages)
+    })
+
+@router.route('eventbridge', sources=(EventRouter.ANY_SOURCE,))
+def handle_eventbridge_event(event, context):
+    """
+    EventBridge event'lerini işler (zamanlanmış event'ler hariç)
+    """
+    logger.info(f"EventBridge event işleniyor: {event.get('source')} / {event.get('detail-type')}")
+
+    return build_response({
+        'message': 'EventBridge event başarıyla işlendi',
+        'id': event.get('id'),
+        'source': event.get('source'),
+        'detail_type': event.get('detail-type'),
+        'detail': event.get('detail', {}),
+        'timestamp': datetime.now().isoformat()
+    })
+
+@router.route('scheduled', sources=('aws.events',))
 def handle_scheduled_event(event, context):
     """
     Zamanlanmış event'leri işler
@@ -143,32 +492,27 @@ def handle_scheduled_event(event, context):
     # Basit bir zaman damgası işlemi
     current_time = datetime.now()
     
-    return {
-        'statusCode': 200,
-        'body': json.dumps({
-            'message': 'Zamanlanmış görev tamamlandı',
-            'timestamp': current_time.isoformat(),
-            'day_of_week': current_time.strftime('%A'),
-            'remaining_time': context.get_remaining_time_in_millis()
-        }, ensure_ascii=False)
-    }
+    return build_response({
+        'message': 'Zamanlanmış görev tamamlandı',
+        'timestamp': current_time.isoformat(),
+        'day_of_week': current_time.strftime('%A'),
+        'remaining_time': context.get_remaining_time_in_millis()
+    })
 
+@router.route('generic')
 def handle_generic_event(event, context):
     """
     Genel event'leri işler
     """
     logger.info("Genel event işleniyor...")
     
-    return {
-        'statusCode': 200,
-        'body': json.dumps({
-            'message': 'AWS ZERO to YETO - Lambda Örneği',
-            'event': event,
-            'timestamp': datetime.now().isoformat(),
-            'function_name': context.function_name,
-            'function_version': context.function_version
-        }, ensure_ascii=False)
-    }
+    return build_response({
+        'message': 'AWS ZERO to YETO - Lambda Örneği',
+        'event': event,
+        'timestamp': datetime.now().isoformat(),
+        'function_name': context.function_name,
+        'function_version': context.function_version
+    })
 
 # Test fonksiyonu (local development için)
 def test_lambda():
@@ -213,5 +557,7 @@ def test_lambda():
         result = lambda_handler(event, context)
         print(f"Sonuç: {json.dumps(result, indent=2, ensure_ascii=False)}")
 
+INIT_TIMINGS['import:module'] = (time.perf_counter() - _MODULE_START) * 1000
+
 if __name__ == "__main__":
     test_lambda()
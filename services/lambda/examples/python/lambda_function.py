@@ -2,6 +2,20 @@ import json
 import os
 from datetime import datetime
 
+# Opsiyonel hızlı JSON backend'i: orjson varsa onu, yoksa girintisiz stdlib encoder'ı kullan.
+# lambda_example.py'deki helper ile aynıdır (bu dosya tek başına deploy edildiği için kopyalanmıştır);
+# OPT_NON_STR_KEYS, stdlib gibi int/float/bool/None anahtarları string'e çevirir.
+try:
+    import orjson
+    
+    def dumps(obj):
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    JSON_BACKEND = 'orjson'
+except ImportError:
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=str).encode
+    JSON_BACKEND = 'json'
+
 def handler(event, context):
     """
     AWS Lambda handler function
@@ -24,7 +38,7 @@ def handler(event, context):
                 "Content-Type": "application/json",
                 "Access-Control-Allow-Origin": "*"
             },
-            "body": json.dumps(response_body, indent=2)
+            "body": dumps(response_body)
         }
         
         return response
@@ -37,10 +51,10 @@ def handler(event, context):
                 "Content-Type": "application/json",
                 "Access-Control-Allow-Origin": "*"
             },
-            "body": json.dumps({
+            "body": dumps({
                 "error": str(e),
                 "message": "Lambda function error"
-            }, indent=2)
+            })
         }
         
         return error_response
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AWS ZERO to YETO - Lokal Lambda Çağırma Harness'ı
+
+Kaydedilmiş event dosyalarını (API Gateway, S3, zamanlanmış) repodaki herhangi
+bir handler'a karşı çalıştırır. AWS çağrıları ana process'te çalışan moto
+sunucusuna (AWS_ENDPOINT_URL) yönlendirilir.
+
+- Cold start: her ölçüm için yeni bir subprocess'te modül import süresi ve ilk
+  çağrı süresi ölçülür. Subprocess handler'dan önce boto3/moto import etmez,
+  böylece import süresi handler'ın gerçek bağımlılık maliyetini içerir.
+- Warm: aynı process'te handler döngüde çağrılır, gecikme ve throughput raporlanır.
+- Bellek: her subprocess'in kendi tepe RSS'i (VmHWM) ve handler import/çağrısının
+  taban çizgisine göre tepe artışı raporlanır (yalnız Linux, /proc gerekir).
+
+Kullanım:
+    pip install 'moto[server]'
+    python lambda_harness.py --handler lambda_example --event ../events/api_gateway.json
+    python lambda_harness.py --handler converter_lambda --event ../events/s3_pptx_upload.json --seed-file deck.pptx
+    python lambda_harness.py --all
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+EVENTS_DIR = Path(__file__).resolve().parent.parent / 'events'
+
+# Harness'ın tanıdığı handler'lar: isim -> (dosya, fonksiyon)
+HANDLERS = {
+    'lambda_example': ('services/lambda/examples/python/lambda_example.py', 'lambda_handler'),
+    'lambda_function': ('services/lambda/examples/python/lambda_function.py', 'handler'),
+    'converter_lambda': ('examples/codeArtifact-lambda-layer/converter_lambda.py', 'lambda_handler'),
+    'dashboard_lambda': ('examples/codeArtifact-lambda-layer/dashboard_lambda.py', 'lambda_handler'),
+}
+
+# --all ile çalıştırılan handler/event eşleşmeleri
+DEFAULT_SCENARIOS = [
+    ('lambda_example', 'api_gateway.json'),
+    ('lambda_example', 's3_put.json'),
+    ('lambda_example', 'scheduled.json'),
+    ('lambda_function', 'api_gateway.json'),
+    ('converter_lambda', 's3_pptx_upload.json'),
+    ('dashboard_lambda', 's3_metadata_created.json'),
+]
+
+HARNESS_ENV = {
+    'AWS_ACCESS_KEY_ID': 'testing',
+    'AWS_SECRET_ACCESS_KEY': 'testing',
+    'AWS_SECURITY_TOKEN': 'testing',
+    'AWS_SESSION_TOKEN': 'testing',
+    'AWS_DEFAULT_REGION': 'us-east-1',
+    'AWS_LAMBDA_FUNCTION_VERSION': '$LATEST',
+}
+
+
+class MockContext:
+    """Lambda context nesnesinin lokal karşılığı"""
+
+    def __init__(self, function_name, timeout_ms=30000, memory_mb=512):
+        self.function_name = function_name
+        self.function_version = '$LATEST'
+        self.memory_limit_in_mb = memory_mb
+        self.aws_request_id = 'harness-request'
+        self.invoked_function_arn = f'arn:aws:lambda:us-east-1:123456789012:function:{function_name}'
+        self._deadline = time.monotonic() + timeout_ms / 1000
+
+    def get_remaining_time_in_millis(self):
+        return max(int((self._deadline - time.monotonic()) * 1000), 0)
+
+
+def resolve_handler(name):
+    """'lambda_example' gibi bir isim veya 'dosya.py:fonksiyon' kabul eder"""
+    if name in HANDLERS:
+        path, function = HANDLERS[name]
+        return REPO_ROOT / path, function
+    path, _, function = name.partition(':')
+    return Path(path).resolve(), function or 'lambda_handler'
+
+
+def s3_objects_in_event(event):
+    for record in event.get('Records', []):
+        if 's3' in record:
+            yield record['s3']['bucket']['name'], record['s3']['object']['key']
+
+
+def sample_pptx():
+    """python-pptx kuruluysa küçük bir sunum üret"""
+    try:
+        from io import BytesIO
+        from pptx import Presentation
+    except ImportError:
+        return None
+    presentation = Presentation()
+    for i in range(1, 6):
+        slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+        slide.shapes.title.text = f'Harness Slayt {i}'
+        slide.placeholders[1].text = f'AWS ZERO to YETO örnek içerik {i}'
+    buffer = BytesIO()
+    presentation.save(buffer)
+    return buffer.getvalue()
+
+
+def seed_aws(event, seed_file):
+    """
+    Event'te geçen bucket ve objeleri moto sunucusunda oluştur.
+    Handler'a geçirilecek ek ortam değişkenlerini döndürür.
+    """
+    import boto3
+
+    s3 = boto3.client('s3')
+    env = {}
+    created = set()
+    for bucket, key in s3_objects_in_event(event):
+        if bucket not in created:
+            s3.create_bucket(Bucket=bucket)
+            created.add(bucket)
+            env.setdefault('BUCKET_NAME', bucket)
+
+        if seed_file:
+            body = Path(seed_file).read_bytes()
+        elif key.lower().endswith('.pptx'):
+            body = sample_pptx() or b'not a real pptx'
+        elif key.lower().endswith('.json'):
+            name = Path(key).stem
+            body = json.dumps({
+                'pdf_name': f'{name}.pdf',
+                'original_name': f'{name}.pptx',
+                'slide_count': 5,
+                'create_date': '2024-01-01T00:00:00Z',
+                'pdf_path': f'pdfs/{name}.pdf',
+                'source_path': f'pptxs/{name}.pptx'
+            }).encode('utf-8')
+        else:
+            body = b'zero-to-yeto'
+        s3.put_object(Bucket=bucket, Key=key, Body=body)
+    return env
+
+
+def start_moto_server():
+    """Rastgele bir portta moto sunucusu başlat, endpoint URL'ini döndür"""
+    import logging
+    from moto.server import ThreadedMotoServer
+
+    # İstek başına erişim loglarını rapordan uzak tut
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    server = ThreadedMotoServer(ip_address='127.0.0.1', port=0, verbose=False)
+    server.start()
+    host, port = server.get_host_and_port()
+    return server, f'http://{host}:{port}'
+
+
+def reset_moto_server(endpoint):
+    """Her cold run'ın temiz bir AWS durumuyla başlaması için moto'yu sıfırla"""
+    from urllib.request import Request, urlopen
+
+    urlopen(Request(f'{endpoint}/moto-api/reset', method='POST')).close()
+
+
+def proc_status_kb(field):
+    """
+    /proc/self/status'tan bir bellek alanını (VmRSS, VmHWM) KB olarak okur.
+
+    ru_maxrss fork/exec'te ana process'in tepe değerini devralabildiği için
+    (moto sunucusu ana process'te) kullanılmaz; VmHWM exec ile gelen yeni
+    adres alanına aittir. /proc olmayan platformlarda None döner.
+    """
+    try:
+        with open('/proc/self/status', encoding='ascii') as status:
+            for line in status:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def reset_peak_rss():
+    """VmHWM'i o anki RSS'e çeker (Linux 4.0+); desteklenmiyorsa sessizce geçer"""
+    try:
+        with open('/proc/self/clear_refs', 'w', encoding='ascii') as clear_refs:
+            clear_refs.write('5')
+    except OSError:
+        pass
+
+
+def worker(args):
+    """
+    Subprocess içinde çalışır: import + ilk çağrı + warm döngü, sonuç JSON olarak stdout'a.
+    AWS durumu ana process'te hazırlanır; burada handler'dan önce AWS ile ilgili
+    hiçbir şey import edilmez.
+    """
+    event = json.loads(Path(args.event).read_text(encoding='utf-8'))
+    path, function_name = resolve_handler(args.handler)
+    sys.path.insert(0, str(path.parent))
+
+    result = {}
+    # Handler'dan önceki taban çizgisi: yalnız yorumlayıcı + harness
+    baseline_kb = proc_status_kb('VmRSS')
+    reset_peak_rss()
+    with open(os.devnull, 'w') as devnull:
+        with contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            spec = importlib.util.spec_from_file_location(path.stem, path)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[path.stem] = module
+            spec.loader.exec_module(module)
+            handler = getattr(module, function_name)
+            result['import_ms'] = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            response = handler(event, MockContext(path.stem))
+            result['first_invoke_ms'] = (time.perf_counter() - start) * 1000
+
+            warm = []
+            loop_start = time.perf_counter()
+            for _ in range(args.warm):
+                start = time.perf_counter()
+                handler(event, MockContext(path.stem))
+                warm.append((time.perf_counter() - start) * 1000)
+            loop_elapsed = time.perf_counter() - loop_start
+
+    result['status_code'] = response.get('statusCode') if isinstance(response, dict) else None
+    result['warm_ms'] = warm
+    result['warm_throughput'] = len(warm) / loop_elapsed if warm and loop_elapsed else None
+    peak_kb = proc_status_kb('VmHWM')
+    result['max_rss_kb'] = peak_kb
+    result['handler_rss_kb'] = peak_kb - baseline_kb if peak_kb is not None and baseline_kb is not None else None
+    print(json.dumps(result))
+
+
+def run_subprocess(handler, event, seed_file, warm, endpoint):
+    reset_moto_server(endpoint)
+    seeded_env = seed_aws(json.loads(Path(event).read_text(encoding='utf-8')), seed_file)
+
+    command = [sys.executable, __file__, '--worker', '--handler', handler,
+               '--event', str(event), '--warm', str(warm)]
+    env = dict(os.environ, **seeded_env)
+    completed = subprocess.run(command, capture_output=True, text=True, env=env)
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1] if completed.stderr else 'worker hatası')
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(int(q * len(values)), len(values) - 1)]
+
+
+def benchmark(handler, event, seed_file, cold_runs, warm, endpoint):
+    """cold_runs adet taze process; sonuncusu warm döngüyü de çalıştırır"""
+    print(f"\n🧪 {handler} <- {Path(event).name}")
+    try:
+        runs = [run_subprocess(handler, event, seed_file, warm if i == cold_runs - 1 else 0, endpoint)
+                for i in range(cold_runs)]
+    except Exception as e:
+        print(f"   ❌ Çalıştırılamadı: {str(e)}")
+        return
+
+    imports = [run['import_ms'] for run in runs]
+    firsts = [run['first_invoke_ms'] for run in runs]
+    warm_ms = runs[-1]['warm_ms']
+    rss = [run['max_rss_kb'] for run in runs if run['max_rss_kb']]
+    handler_rss = [run['handler_rss_kb'] for run in runs if run['handler_rss_kb'] is not None]
+
+    print(f"   Status code:         {runs[-1]['status_code']}")
+    print(f"   Cold import (p50):   {statistics.median(imports):.1f} ms")
+    print(f"   Cold 1. çağrı (p50): {statistics.median(firsts):.1f} ms")
+    if warm_ms:
+        print(f"   Warm p50 / p99:      {percentile(warm_ms, 0.5):.2f} / {percentile(warm_ms, 0.99):.2f} ms")
+        print(f"   Warm throughput:     {runs[-1]['warm_throughput']:.0f} çağrı/sn")
+    if rss:
+        print(f"   Tepe RSS:            {max(rss) / 1024:.1f} MB")
+    if handler_rss:
+        print(f"   Handler tepe artışı: {max(handler_rss) / 1024:.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Lokal Lambda cold/warm benchmark harness')
+    parser.add_argument('--handler', help=f"Handler adı ({', '.join(HANDLERS)}) veya dosya.py:fonksiyon")
+    parser.add_argument('--event', help='Event JSON dosyası')
+    parser.add_argument('--seed-file', help='Event\'teki S3 objelerine yüklenecek dosya (ör. gerçek bir .pptx)')
+    parser.add_argument('--cold-runs', type=int, default=3, help='Cold start ölçümü için subprocess sayısı')
+    parser.add_argument('--warm', type=int, default=100, help='Warm döngüdeki çağrı sayısı')
+    parser.add_argument('--all', action='store_true', help='Varsayılan tüm senaryoları çalıştır')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args)
+        return
+
+    if importlib.util.find_spec('moto') is None or importlib.util.find_spec('flask') is None:
+        print("❌ moto sunucu modu kurulu değil: pip install 'moto[server]'")
+        return
+
+    if args.all:
+        scenarios = [(handler, EVENTS_DIR / event) for handler, event in DEFAULT_SCENARIOS]
+    elif args.handler and args.event:
+        scenarios = [(args.handler, Path(args.event))]
+    else:
+        parser.error('--handler ve --event ya da --all gerekli')
+
+    server, endpoint = start_moto_server()
+    os.environ.update(HARNESS_ENV, AWS_ENDPOINT_URL=endpoint)
+
+    print("🏁 AWS ZERO to YETO - Lambda Harness")
+    print("=" * 50)
+    try:
+        for handler, event in scenarios:
+            benchmark(handler, event, args.seed_file, max(args.cold_runs, 1), args.warm, endpoint)
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AWS ZERO to YETO - Lambda Yanıt Serialization Mikrobenchmark'ı
+
+Tipik Lambda yanıtlarını farklı JSON yöntemleriyle serialize eder ve yanıt
+başına byte ve mikrosaniye değerlerini karşılaştırır:
+
+- json.dumps(indent=2)        (eski lambda_function.handler)
+- json.dumps(ensure_ascii=False)  (eski lambda_example handler'ları)
+- lambda_example.dumps        (orjson varsa orjson, yoksa girintisiz stdlib)
+
+Kullanım:
+    python response_benchmark.py
+    pip install orjson && python response_benchmark.py
+"""
+
+import json
+import timeit
+from datetime import datetime
+
+from lambda_example import dumps, JSON_BACKEND
+
+
+def sample_payloads():
+    """Lambda örneklerindeki yanıtlara benzer payload'lar"""
+    api_response = {
+        'message': 'AWS ZERO to YETO - Lambda API Gateway Örneği',
+        'method': 'POST',
+        'path': '/test',
+        'body': '{"test": "data"}',
+        'timestamp': datetime.now().isoformat(),
+        'remaining_time': 30000
+    }
+    s3_batch = {
+        'message': 'S3 event başarıyla işlendi',
+        'processed_files': [
+            {
+                'bucket': 'zero-to-yeto-uploads',
+                'key': f'uploads/2024/belge-{i}.pdf',
+                'size': 1024 * i,
+                'type': 'application/pdf',
+                'event': 'ObjectCreated:Put'
+            }
+            for i in range(100)
+        ],
+        'count': 100,
+        'failed_count': 0
+    }
+    api_event = {
+        'resource': '/{proxy+}',
+        'path': '/test',
+        'httpMethod': 'POST',
+        'headers': {f'X-Header-{i}': f'değer-{i}' for i in range(20)},
+        'queryStringParameters': {'q': 'arama', 'page': '2'},
+        'requestContext': {
+            'accountId': '123456789012',
+            'requestId': 'c6af9ac6-7b61-11e6-9a41-93e8deadbeef',
+            'identity': {'sourceIp': '203.0.113.1', 'userAgent': 'curl/8.0'}
+        },
+        'body': json.dumps({'items': list(range(50))})
+    }
+    generic_echo = {
+        'message': 'AWS ZERO to YETO - Lambda Örneği',
+        'event': api_event,
+        'timestamp': datetime.now().isoformat(),
+        'function_name': 'zero-to-yeto-function',
+        'function_version': '$LATEST'
+    }
+    return {
+        'api_response': api_response,
+        's3_batch_100': s3_batch,
+        'generic_echo': generic_echo
+    }
+
+
+def main():
+    serializers = {
+        'json indent=2': lambda obj: json.dumps(obj, indent=2),
+        'json ensure_ascii=False': lambda obj: json.dumps(obj, ensure_ascii=False),
+        f'dumps ({JSON_BACKEND})': dumps
+    }
+
+    print("⏱️ AWS ZERO to YETO - Lambda Yanıt Serialization Benchmark'ı")
+    print("=" * 70)
+    print(f"{'Payload':<16} {'Yöntem':<26} {'Byte':>8} {'µs/yanıt':>10}")
+    print("-" * 70)
+
+    for payload_name, payload in sample_payloads().items():
+        for serializer_name, serialize in serializers.items():
+            size = len(serialize(payload).encode('utf-8'))
+            runs, total = timeit.Timer(lambda: serialize(payload)).autorange()
+            print(f"{payload_name:<16} {serializer_name:<26} {size:>8} {total / runs * 1e6:>10.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()